@@ -15,6 +15,9 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",  # noqa: F405
+        # Tests run against an in-memory database: no journal or fsync on commit,
+        # and each xdist worker process gets its own copy.
+        "TEST": {"NAME": ":memory:"},
     }
 }
 
@@ -11,3 +11,6 @@ urlpatterns = [
     # DRF login for browsable API (development only)
     path("api-auth/", include("rest_framework.urls")),
 ]
+
+# JSON 404s under /api/, including codes rejected by the URL converters
+handler404 = "core.views.errors.not_found"
@@ -0,0 +1,73 @@
+"""
+Authentication classes for OIUEEI.
+
+Every JWT-authenticated request loads its user by user_code. That lookup goes
+through the default cache for USER_CACHE_TIMEOUT seconds; saving or deleting a
+user drops the cached copy (see the receiver in core.models.user).
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from core.models import User
+from core.models.user import user_cache_key
+
+
+def get_user_by_code(user_code):
+    """
+    Return the user with user_code, or None if there is none.
+
+    Reads through the cache unless USER_CACHE_TIMEOUT is 0. Only use this for
+    read-only lookups: views that modify and save a user should load it fresh.
+    """
+    timeout = getattr(settings, "USER_CACHE_TIMEOUT", 0)
+    if not timeout:
+        return User.objects.filter(user_code=user_code).first()
+
+    key = user_cache_key(user_code)
+    user = cache.get(key)
+    if user is None:
+        user = User.objects.filter(user_code=user_code).first()
+        if user is not None:
+            cache.set(key, user, timeout)
+    return user
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that loads the token's user with get_user_by_code.
+
+    Only the fetch differs from simplejwt's get_user; the active-user and
+    revoke-token checks are kept. The cache is keyed by user_code, so any other
+    USER_ID_FIELD falls back to simplejwt's uncached lookup.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_FIELD != "user_code":
+            return super().get_user(validated_token)
+
+        try:
+            user_code = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        user = get_user_by_code(user_code)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+
+        return user
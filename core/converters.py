@@ -0,0 +1,35 @@
+"""
+URL path converters for OIUEEI.
+"""
+
+from core.utils import ID_CHARS, ID_LENGTH
+
+
+class CodeConverter:
+    """
+    Match the 6-character uppercase codes made by generate_id.
+
+    Malformed codes fail URL resolution with a 404 before any view or query runs
+    (a JSON {"error": ...} body under /api/, see config.urls.handler404). That is
+    also what unauthenticated requests get for them, not a 401.
+    """
+
+    regex = f"[{ID_CHARS}]{{{ID_LENGTH}}}"
+
+    def to_python(self, value):
+        return value
+
+    def to_url(self, value):
+        return value
+
+
+class VisibilityActionConverter:
+    """Match the FAQ visibility actions, "hide" and "show"."""
+
+    regex = "hide|show"
+
+    def to_python(self, value):
+        return value
+
+    def to_url(self, value):
+        return value
@@ -0,0 +1,35 @@
+"""
+Outgoing email helpers for OIUEEI.
+"""
+
+import logging
+import threading
+
+from django.conf import settings
+from django.core.mail import send_mail
+
+logger = logging.getLogger(__name__)
+
+
+def _send(kwargs):
+    try:
+        send_mail(**kwargs)
+    except Exception:
+        logger.exception("Failed to send email to %s", kwargs.get("recipient_list"))
+
+
+def send_mail_async(**kwargs):
+    """
+    Send an email without holding up the response when EMAIL_SEND_ASYNC is on.
+
+    Takes the same keyword arguments as send_mail. With EMAIL_SEND_ASYNC the
+    SMTP round trip runs on a background thread, which is returned; failures
+    are logged there instead of raised. Otherwise the email is sent inline
+    and None is returned.
+    """
+    if not getattr(settings, "EMAIL_SEND_ASYNC", False):
+        send_mail(**kwargs)
+        return None
+    thread = threading.Thread(target=_send, args=(kwargs,), name="send-mail")
+    thread.start()
+    return thread
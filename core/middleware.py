@@ -0,0 +1,27 @@
+"""
+Middleware for OIUEEI.
+"""
+
+
+def get_client_ip(request):
+    """Return the client IP: first X-Forwarded-For entry, else REMOTE_ADDR."""
+    x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+    if x_forwarded_for:
+        return x_forwarded_for.split(",")[0].strip()
+    return request.META.get("REMOTE_ADDR", "unknown")
+
+
+class ClientIPMiddleware:
+    """
+    Set request.client_ip once per request for views and security logging.
+
+    X-Forwarded-For is client-supplied, so this is for logging only; rate
+    limiting keeps keying on REMOTE_ADDR.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.client_ip = get_client_ip(request)
+        return self.get_response(request)
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0016_add_order_fields"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="bookingperiod",
+            index=models.Index(
+                fields=["thing_code", "-booking_created"], name="booking_thing_created_idx"
+            ),
+        ),
+    ]
@@ -62,6 +62,12 @@ class BookingPeriod(models.Model):
     class Meta:
         app_label = "core"
         db_table = "booking_periods"
+        indexes = [
+            # Owner booking lists: filter by thing, newest first
+            models.Index(
+                fields=["thing_code", "-booking_created"], name="booking_thing_created_idx"
+            ),
+        ]
 
     def __str__(self):
         if self.start_date and self.end_date:
@@ -66,6 +66,20 @@ class RSVP(models.Model):
         expiry_time = self.rsvp_created + timedelta(hours=expiry_hours)
         return timezone.now() < expiry_time
 
+    @classmethod
+    def consume(cls, rsvp_code):
+        """
+        Delete the RSVP with rsvp_code and return it (None if there is none).
+
+        The DELETE is the claim: if concurrent requests use the same link, only
+        the one whose DELETE removes the row gets the RSVP back.
+        """
+        rsvp = cls.objects.filter(rsvp_code=rsvp_code).first()
+        if rsvp is None:
+            return None
+        deleted, _ = cls.objects.filter(rsvp_code=rsvp_code).delete()
+        return rsvp if deleted else None
+
     @classmethod
     def create_for_booking(cls, action, booking, owner_email):
         """
@@ -5,7 +5,10 @@ User model for OIUEEI.
 from datetime import date
 
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
+from django.core.cache import cache
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 
 from core.utils import generate_id
 
@@ -71,6 +74,22 @@ class User(AbstractBaseUser):
         return self.is_superuser
 
     def update_last_activity(self):
-        """Update the user's last activity date."""
-        self.user_last_activity = date.today()
+        """Update the user's last activity date (no write if it is already today)."""
+        today = date.today()
+        if self.user_last_activity == today:
+            return
+        self.user_last_activity = today
         self.save(update_fields=["user_last_activity"])
+
+
+def user_cache_key(user_code):
+    """Cache key for the authenticated-user cache (see core.authentication)."""
+    return f"user:{user_code}"
+
+
+# Connected here, with the model, so saves and deletes from anywhere (shell, admin,
+# management commands) drop the cached copy, not only once core.authentication is imported.
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def _drop_cached_user(sender, instance, **kwargs):
+    cache.delete(user_cache_key(instance.user_code))
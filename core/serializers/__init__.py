@@ -15,7 +15,12 @@ from .collection import (
     CollectionUpdateSerializer,
 )
 from .faq import FAQAnswerSerializer, FAQCreateSerializer, FAQSerializer
-from .thing import ThingCreateSerializer, ThingSerializer, ThingUpdateSerializer
+from .thing import (
+    ThingBulkCreateSerializer,
+    ThingCreateSerializer,
+    ThingSerializer,
+    ThingUpdateSerializer,
+)
 from .user import UserPublicSerializer, UserSerializer, UserUpdateSerializer
 
 __all__ = [
@@ -32,6 +37,7 @@ __all__ = [
     "CollectionRemoveInviteSerializer",
     "ThingSerializer",
     "ThingCreateSerializer",
+    "ThingBulkCreateSerializer",
     "ThingUpdateSerializer",
     "FAQSerializer",
     "FAQCreateSerializer",
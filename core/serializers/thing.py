@@ -5,7 +5,7 @@ Thing serializers for OIUEEI.
 from rest_framework import serializers
 
 from core.models import Thing
-from core.utils import cloudinary_url
+from core.utils import cloudinary_url, cloudinary_urls
 from core.validators import ImageIdField, SafeHeadlineField, validate_image_id
 
 
@@ -46,7 +46,7 @@ class ThingSerializer(serializers.ModelSerializer):
         return cloudinary_url(obj.thing_thumbnail)
 
     def get_thing_pictures_urls(self, obj):
-        return [cloudinary_url(pic_id) for pic_id in obj.thing_pictures if pic_id]
+        return cloudinary_urls(obj.thing_pictures)
 
 
 class ImageIdListField(serializers.ListField):
@@ -78,6 +78,13 @@ class ThingCreateSerializer(serializers.ModelSerializer):
         ]
 
 
+class ThingBulkCreateSerializer(serializers.Serializer):
+    """Serializer for creating several things in one request."""
+
+    items = ThingCreateSerializer(many=True, allow_empty=False, max_length=20)
+    collection_code = serializers.CharField(max_length=6, required=False)
+
+
 class ThingUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating a thing."""
 
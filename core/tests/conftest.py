@@ -2,29 +2,122 @@
 Pytest fixtures for OIUEEI tests.
 """
 
+import copy
+from datetime import datetime
+from datetime import timezone as dt_timezone
+
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from core.models import FAQ, RSVP, Collection, Theeeme, Thing, User
 
+try:
+    import nplusone.ext.django  # noqa: F401 - hooks the ORM so lazy loads are reported
+    from nplusone.core import profiler
+except ImportError as e:
+    # Without it the N+1 guard below would silently pass everything
+    raise ImportError(
+        "The test suite needs nplusone: pip install -r requirements/development.txt"
+    ) from e
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hasher():
+    """Use the cheap MD5 hasher so any password set during tests skips PBKDF2."""
+    with override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]):
+        yield
+
 
 @pytest.fixture(autouse=True)
-def default_theeeme(db):
-    """Create the default theeeme for all tests."""
-    theeeme, _ = Theeeme.objects.get_or_create(
-        theeeme_code="JMPA01",
-        defaults={
-            "theeeme_name": "BAR_CEL_ONA",
-            "theeeme_01": "FFCA2C",
-            "theeeme_02": "CB4E22",
-            "theeeme_03": "827F2A",
-            "theeeme_04": "2B9A9E",
-            "theeeme_05": "4F3B28",
-            "theeeme_06": "FFF2EB",
-        },
-    )
-    return theeeme
+def _clear_cache():
+    """Empty the cache after each test; it is not rolled back with the database."""
+    yield
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def nplusone_profiler(request):
+    """
+    Fail a test on any N+1 lazy load.
+
+    Mark a test with @pytest.mark.skip_nplusone to opt it out.
+    """
+    if request.node.get_closest_marker("skip_nplusone"):
+        yield
+        return
+    with profiler.Profiler():
+        yield
+
+
+class _FrozenClock:
+    """Stand-in for timezone.now that keeps returning one instant until moved."""
+
+    def __init__(self, instant):
+        self.instant = instant
+
+    def __call__(self):
+        return self.instant
+
+    def move_to(self, instant):
+        self.instant = instant
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """
+    Pin django.utils.timezone.now to 2024-01-01 12:00 UTC for one test.
+
+    Call frozen_clock.move_to() to jump ahead. Field defaults bound to the real
+    timezone.now (e.g. rsvp_created) are not affected; pass those explicitly.
+    """
+    clock = _FrozenClock(datetime(2024, 1, 1, 12, 0, tzinfo=dt_timezone.utc))
+    monkeypatch.setattr(timezone, "now", clock)
+    return clock
+
+
+DEFAULT_THEEEME = {
+    "theeeme_name": "BAR_CEL_ONA",
+    "theeeme_01": "FFCA2C",
+    "theeeme_02": "CB4E22",
+    "theeeme_03": "827F2A",
+    "theeeme_04": "2B9A9E",
+    "theeeme_05": "4F3B28",
+    "theeeme_06": "FFF2EB",
+}
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    """
+    Create the test database with the default theeeme (JMPA01) already in it.
+
+    The row is written during setup, outside every per-test transaction, so
+    no rollback removes it whatever order the tests run in.
+    """
+    with django_db_blocker.unblock():
+        Theeeme.objects.get_or_create(theeeme_code="JMPA01", defaults=DEFAULT_THEEEME)
+
+
+@pytest.fixture(scope="session")
+def default_theeeme(django_db_setup, django_db_blocker):
+    """Return the default theeeme created with the test database."""
+    with django_db_blocker.unblock():
+        return Theeeme.objects.get(theeeme_code="JMPA01")
+
+
+@pytest.fixture
+def theeeme_query_budget():
+    """Fail the test if it reads the theeemes table more than once (N+1 on collection_theeeme)."""
+    with CaptureQueriesContext(connection) as ctx:
+        yield
+    reads = [q["sql"] for q in ctx.captured_queries if 'FROM "theeemes"' in q["sql"]]
+    assert len(reads) <= 1, f"{len(reads)} theeeme reads: {reads}"
 
 
 @pytest.fixture
@@ -33,6 +126,21 @@ def api_client():
     return APIClient()
 
 
+@pytest.fixture(scope="module")
+def shared_api_client():
+    """Return an API client reused by every test in a module."""
+    return APIClient()
+
+
+@pytest.fixture
+def scenario_client(shared_api_client):
+    """Return the module's shared API client with credentials and cookies reset."""
+    shared_api_client.credentials()
+    shared_api_client.defaults.pop("HTTP_AUTHORIZATION", None)
+    shared_api_client.cookies.clear()
+    return shared_api_client
+
+
 @pytest.fixture
 def user(db):
     """Create a test user."""
@@ -53,6 +161,57 @@ def user2(db):
     )
 
 
+@pytest.fixture
+def user3(db):
+    """Create a third test user (not owner, not questioner, not invited)."""
+    return User.objects.create(
+        user_code="TEST03",
+        user_email="test3@example.com",
+        user_name="Test User 3",
+    )
+
+
+@pytest.fixture(scope="session")
+def owner_user(django_db_setup, django_db_blocker):
+    """
+    Create the scenario owner once per session.
+
+    Returns a (user, access_token) tuple. The row lives outside the per-test
+    transaction, so tests must not rely on mutations to it surviving.
+    """
+    with django_db_blocker.unblock():
+        owner, _ = User.objects.get_or_create(
+            user_code="OWNER1",
+            defaults={"user_email": "owner@example.com", "user_name": "Owner"},
+        )
+        token = str(RefreshToken.for_user(owner).access_token)
+    return owner, token
+
+
+@pytest.fixture(scope="session")
+def friend_user(django_db_setup, django_db_blocker):
+    """Create the scenario friend once per session. Returns (user, access_token)."""
+    with django_db_blocker.unblock():
+        friend, _ = User.objects.get_or_create(
+            user_code="FRND01",
+            defaults={"user_email": "friend@example.com", "user_name": "Friend"},
+        )
+        token = str(RefreshToken.for_user(friend).access_token)
+    return friend, token
+
+
+@pytest.fixture(scope="session")
+def owner_auth_header(owner_user):
+    """Return the Authorization header for the scenario owner."""
+    return f"Bearer {owner_user[1]}"
+
+
+@pytest.fixture(scope="session")
+def friend_auth_header(friend_user):
+    """Return the Authorization header for the scenario friend."""
+    return f"Bearer {friend_user[1]}"
+
+
 @pytest.fixture
 def authenticated_client(api_client, user):
     """Return an authenticated API client."""
@@ -114,6 +273,35 @@ def thing(db, user, collection):
     return t
 
 
+@pytest.fixture(scope="module")
+def collection_row(default_theeeme, django_db_blocker):
+    """
+    Insert one plain collection per test module, deleted when the module finishes.
+
+    Use pooled_collection in tests; it hands out an independent copy.
+    """
+    with django_db_blocker.unblock():
+        row = Collection.objects.create(
+            collection_owner="ABC123",
+            collection_headline="My Collection",
+            collection_theeeme=default_theeeme,
+        )
+    yield row
+    with django_db_blocker.unblock():
+        row.delete()
+
+
+@pytest.fixture
+def pooled_collection(db, collection_row):
+    """
+    Return a fresh in-memory copy of the module's shared collection row.
+
+    Saves made by the test are rolled back with its transaction, so the row
+    itself stays pristine for the next test.
+    """
+    return copy.deepcopy(collection_row)
+
+
 @pytest.fixture
 def faq(db, user2, thing):
     """Create a test FAQ."""
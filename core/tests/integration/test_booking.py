@@ -681,6 +681,26 @@ class TestMyBookingsAndOwnerBookings:
         assert len(response.data) == 1
         assert response.data[0]["requester_code"] == user2.user_code
 
+    def test_owner_bookings_single_query(
+        self, authenticated_client, user, user2, lend_thing, django_assert_num_queries
+    ):
+        """owner-bookings reads the bookings in one query (plus the auth user lookup)."""
+        for offset in range(3):
+            BookingPeriod.objects.create(
+                thing_code=lend_thing.thing_code,
+                requester_code=user2.user_code,
+                requester_email=user2.user_email,
+                owner_code=user.user_code,
+                start_date=date.today() + timedelta(days=10 * offset),
+                end_date=date.today() + timedelta(days=10 * offset + 3),
+            )
+
+        with django_assert_num_queries(2):
+            response = authenticated_client.get("/api/v1/owner-bookings/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 3
+
     def test_my_bookings_empty_when_no_bookings(self, authenticated_client):
         """my-bookings returns empty list when user has no bookings."""
         response = authenticated_client.get("/api/v1/my-bookings/")
@@ -5,6 +5,10 @@ Integration tests for OIUEEI API views.
 import pytest
 from rest_framework import status
 
+_thing_url = "/api/v1/things/{code}/".format
+_thing_request_url = "/api/v1/things/{code}/request/".format
+_thing_faq_url = "/api/v1/things/{code}/faq/".format
+
 
 @pytest.mark.django_db
 class TestAuthViews:
@@ -145,6 +149,23 @@ class TestCollectionViews:
         assert len(response.data) == 1
         assert response.data[0]["collection_code"] == collection.collection_code
 
+    def test_list_collections_reads_theeemes_once(
+        self, authenticated_client, user, theeeme, theeeme_query_budget
+    ):
+        """Listing several collections should not load each theeeme separately."""
+        from core.models import Collection
+
+        for headline in ["First", "Second", "Third"]:
+            Collection.objects.create(
+                collection_owner=user.user_code,
+                collection_headline=headline,
+                collection_theeeme=theeeme,
+            )
+
+        response = authenticated_client.get("/api/v1/collections/")
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 3
+
     def test_create_collection(self, authenticated_client, user):
         """Should create a new collection."""
         response = authenticated_client.post(
@@ -537,16 +558,52 @@ class TestThingViews:
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["thing_headline"] == "New Thing"
 
+    def test_bulk_create_things(self, authenticated_client, user, collection):
+        """Should create several things and add them to the collection in one request."""
+        from core.models import Collection
+
+        response = authenticated_client.post(
+            "/api/v1/things/bulk/",
+            {
+                "collection_code": collection.collection_code,
+                "items": [
+                    {"thing_headline": "First", "thing_type": "GIFT_THING"},
+                    {"thing_headline": "Second", "thing_type": "SELL_THING", "thing_fee": "9.00"},
+                ],
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [t["thing_headline"] for t in response.data] == ["First", "Second"]
+
+        thing_codes = [t["thing_code"] for t in response.data]
+        user.refresh_from_db()
+        collection_things = Collection.objects.values_list("collection_things", flat=True).get(
+            pk=collection.pk
+        )
+        assert all(code in user.user_things for code in thing_codes)
+        assert all(code in collection_things for code in thing_codes)
+
+    def test_bulk_create_things_rejects_empty_items(self, authenticated_client):
+        """Should reject a bulk request without items."""
+        response = authenticated_client.post(
+            "/api/v1/things/bulk/",
+            {"items": []},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "items" in response.data
+
     def test_get_thing(self, authenticated_client, thing):
         """Should get thing details."""
-        response = authenticated_client.get(f"/api/v1/things/{thing.thing_code}/")
+        response = authenticated_client.get(_thing_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_200_OK
         assert response.data["thing_headline"] == thing.thing_headline
 
     def test_update_thing(self, authenticated_client, thing):
         """Should update thing."""
         response = authenticated_client.put(
-            f"/api/v1/things/{thing.thing_code}/",
+            _thing_url(code=thing.thing_code),
             {"thing_headline": "Updated Thing"},
             format="json",
         )
@@ -555,7 +612,7 @@ class TestThingViews:
 
     def test_delete_thing(self, authenticated_client, thing):
         """Should delete thing."""
-        response = authenticated_client.delete(f"/api/v1/things/{thing.thing_code}/")
+        response = authenticated_client.delete(_thing_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_204_NO_CONTENT
 
     def test_request_thing(self, authenticated_client, user, user2, thing, collection):
@@ -574,7 +631,7 @@ class TestThingViews:
         client2.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
 
         # Use /request/ endpoint (BookingPeriod flow)
-        response = client2.post(f"/api/v1/things/{thing.thing_code}/request/")
+        response = client2.post(_thing_request_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_200_OK
         assert response.data["message"] == "Booking request sent"
         assert "booking_code" in response.data
@@ -585,7 +642,7 @@ class TestThingViews:
 
     def test_cannot_request_own_thing(self, authenticated_client, thing):
         """Should not request own thing."""
-        response = authenticated_client.post(f"/api/v1/things/{thing.thing_code}/request/")
+        response = authenticated_client.post(_thing_request_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.data["error"] == "Cannot request your own thing"
 
@@ -596,7 +653,7 @@ class TestFAQViews:
 
     def test_list_faqs(self, authenticated_client, thing, faq):
         """Should list FAQs for a thing."""
-        response = authenticated_client.get(f"/api/v1/things/{thing.thing_code}/faq/")
+        response = authenticated_client.get(_thing_faq_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 1
 
@@ -613,7 +670,7 @@ class TestFAQViews:
         client2.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
 
         response = client2.post(
-            f"/api/v1/things/{thing.thing_code}/faq/",
+            _thing_faq_url(code=thing.thing_code),
             {"faq_question": "How big is it?"},
             format="json",
         )
@@ -658,7 +715,7 @@ class TestFAQViews:
     def test_create_faq_denied_for_owner(self, authenticated_client, thing):
         """Owner cannot ask questions about their own thing."""
         response = authenticated_client.post(
-            f"/api/v1/things/{thing.thing_code}/faq/",
+            _thing_faq_url(code=thing.thing_code),
             {"faq_question": "Can I ask myself?"},
             format="json",
         )
@@ -712,7 +769,7 @@ class TestFAQViews:
         client2.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
 
         response = client2.post(
-            f"/api/v1/things/{thing.thing_code}/faq/",
+            _thing_faq_url(code=thing.thing_code),
             {"faq_question": "Is this still available?"},
             format="json",
         )
@@ -814,12 +871,12 @@ class TestSecurityRestrictions:
     def test_thing_access_denied_for_non_invited_user(self, user, user2, thing):
         """Should deny access to thing for non-invited user."""
         client2 = self._get_client_for_user(user2)
-        response = client2.get(f"/api/v1/things/{thing.thing_code}/")
+        response = client2.get(_thing_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_thing_access_allowed_for_owner(self, authenticated_client, thing):
         """Should allow owner to view their thing."""
-        response = authenticated_client.get(f"/api/v1/things/{thing.thing_code}/")
+        response = authenticated_client.get(_thing_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_200_OK
 
     def test_thing_access_allowed_for_invited_user(self, user, user2, thing, collection):
@@ -828,7 +885,7 @@ class TestSecurityRestrictions:
         collection.add_invite(user2.user_code)
 
         client2 = self._get_client_for_user(user2)
-        response = client2.get(f"/api/v1/things/{thing.thing_code}/")
+        response = client2.get(_thing_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_200_OK
 
     # Invited things endpoint tests
@@ -855,7 +912,7 @@ class TestSecurityRestrictions:
     def test_faq_list_denied_for_non_invited_user(self, user, user2, thing):
         """Should deny FAQ list for non-invited user."""
         client2 = self._get_client_for_user(user2)
-        response = client2.get(f"/api/v1/things/{thing.thing_code}/faq/")
+        response = client2.get(_thing_faq_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_faq_list_allowed_for_invited_user(self, user, user2, thing, collection, faq):
@@ -863,42 +920,24 @@ class TestSecurityRestrictions:
         collection.add_invite(user2.user_code)
 
         client2 = self._get_client_for_user(user2)
-        response = client2.get(f"/api/v1/things/{thing.thing_code}/faq/")
+        response = client2.get(_thing_faq_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_200_OK
 
-    def test_faq_detail_denied_for_non_invited_user(self, user, user2, faq, thing):
+    def test_faq_detail_denied_for_non_invited_user(self, user, user2, user3, faq, thing):
         """Should deny FAQ detail for non-invited user."""
         # Make FAQ visible first
         faq.faq_is_visible = True
         faq.save()
 
-        # Create a third user (not owner, not questioner, not invited)
-        from core.models import User
-
-        user3 = User.objects.create(
-            user_code="TEST03",
-            user_email="test3@example.com",
-            user_name="Test User 3",
-        )
-
         client3 = self._get_client_for_user(user3)
         response = client3.get(f"/api/v1/faq/{faq.faq_code}/")
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_faq_create_denied_for_non_invited_user(self, user, user2, thing):
+    def test_faq_create_denied_for_non_invited_user(self, user, user2, user3, thing):
         """Should deny FAQ creation for non-invited user."""
-        # Create a third user
-        from core.models import User
-
-        user3 = User.objects.create(
-            user_code="TEST03",
-            user_email="test3@example.com",
-            user_name="Test User 3",
-        )
-
         client3 = self._get_client_for_user(user3)
         response = client3.post(
-            f"/api/v1/things/{thing.thing_code}/faq/",
+            _thing_faq_url(code=thing.thing_code),
             {"faq_question": "Is this available?"},
             format="json",
         )
@@ -970,7 +1009,7 @@ class TestReservationViews:
         collection.add_invite(user2.user_code)
 
         client2 = self._get_client_for_user(user2)
-        response = client2.post(f"/api/v1/things/{thing.thing_code}/request/")
+        response = client2.post(_thing_request_url(code=thing.thing_code))
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["message"] == "Booking request sent"
@@ -982,7 +1021,7 @@ class TestReservationViews:
 
     def test_request_reservation_denied_for_owner(self, authenticated_client, thing):
         """Should deny owner from requesting their own thing."""
-        response = authenticated_client.post(f"/api/v1/things/{thing.thing_code}/request/")
+        response = authenticated_client.post(_thing_request_url(code=thing.thing_code))
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.data["error"] == "Cannot request your own thing"
@@ -990,7 +1029,7 @@ class TestReservationViews:
     def test_request_reservation_denied_for_non_invited(self, user, user2, thing):
         """Should deny non-invited user from requesting."""
         client2 = self._get_client_for_user(user2)
-        response = client2.post(f"/api/v1/things/{thing.thing_code}/request/")
+        response = client2.post(_thing_request_url(code=thing.thing_code))
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
@@ -1001,14 +1040,14 @@ class TestReservationViews:
         thing.save()
 
         client2 = self._get_client_for_user(user2)
-        response = client2.post(f"/api/v1/things/{thing.thing_code}/request/")
+        response = client2.post(_thing_request_url(code=thing.thing_code))
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.data["error"] == "Thing is not available for reservation"
 
     def test_accept_reservation(self, api_client, user, user2, thing, collection):
         """Should accept reservation via RSVP and change thing status to INACTIVE."""
-        from core.models import RSVP
+        from core.models import RSVP, Thing
         from core.models.booking import BookingPeriod
 
         collection.add_invite(user2.user_code)
@@ -1036,12 +1075,14 @@ class TestReservationViews:
         assert response.data["message"] == "Booking accepted"
         assert response.data["action"] == "BOOKING_ACCEPT"
 
-        # Verify thing status and booking status
-        thing.refresh_from_db()
+        # Verify thing status and booking status (read only the asserted columns)
+        thing_status, thing_available, thing_deal = Thing.objects.values_list(
+            "thing_status", "thing_available", "thing_deal"
+        ).get(pk=thing.pk)
         booking.refresh_from_db()
-        assert thing.thing_status == "INACTIVE"
-        assert thing.thing_available is False
-        assert user2.user_code in thing.thing_deal
+        assert thing_status == "INACTIVE"
+        assert thing_available is False
+        assert user2.user_code in thing_deal
         assert booking.status == "ACCEPTED"
 
     def test_reject_reservation(self, api_client, user, user2, thing, collection):
@@ -1129,7 +1170,7 @@ class TestReservationViews:
         )
 
         client2 = self._get_client_for_user(user2)
-        response = client2.post(f"/api/v1/things/{thing.thing_code}/request/")
+        response = client2.post(_thing_request_url(code=thing.thing_code))
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert response.data["error"] == "You already have a pending request for this thing"
@@ -1159,7 +1200,7 @@ class TestThingAvailabilityVisibility:
         thing.thing_available = False
         thing.save()
 
-        response = authenticated_client.get(f"/api/v1/things/{thing.thing_code}/")
+        response = authenticated_client.get(_thing_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_200_OK
         assert response.data["thing_code"] == thing.thing_code
 
@@ -1173,7 +1214,7 @@ class TestThingAvailabilityVisibility:
         thing.save()
 
         client2 = self._get_client_for_user(user2)
-        response = client2.get(f"/api/v1/things/{thing.thing_code}/")
+        response = client2.get(_thing_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
     def test_visible_thing_visible_to_invited_user(self, user, user2, thing, collection):
@@ -1186,7 +1227,7 @@ class TestThingAvailabilityVisibility:
         thing.save()
 
         client2 = self._get_client_for_user(user2)
-        response = client2.get(f"/api/v1/things/{thing.thing_code}/")
+        response = client2.get(_thing_url(code=thing.thing_code))
         assert response.status_code == status.HTTP_200_OK
 
     def test_invited_things_excludes_hidden(self, user, user2, thing, collection):
@@ -1279,6 +1320,20 @@ class TestSecurityInputValidation:
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data["collection_headline"] == "My Wedding List 2024"
 
+    @pytest.mark.parametrize("code", ["abc123", "ABC12", "ABC1234", "ABC-12"])
+    def test_malformed_code_not_routed(self, authenticated_client, code, django_assert_num_queries):
+        """Codes that generate_id could never produce should 404 without reaching a view."""
+        with django_assert_num_queries(0):
+            response = authenticated_client.get(_thing_url(code=code))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"error": "Not found"}
+
+    def test_malformed_code_unauthenticated_is_404(self, api_client):
+        """URL resolution fails before authentication, so a malformed code is a 404, not a 401."""
+        response = api_client.get(_thing_url(code="abc123"))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"error": "Not found"}
+
     def test_image_id_rejects_path_traversal(self, authenticated_client, user):
         """Should reject path traversal attempts in image IDs."""
         response = authenticated_client.put(
@@ -1325,7 +1380,7 @@ class TestSecurityInputValidation:
 
         # Try to order 100 (should fail)
         response = client2.post(
-            f"/api/v1/things/{order_thing.thing_code}/request/",
+            _thing_request_url(code=order_thing.thing_code),
             {
                 "delivery_date": str(date.today() + timedelta(days=7)),
                 "quantity": 100,
@@ -1336,7 +1391,7 @@ class TestSecurityInputValidation:
 
         # Order 99 should succeed
         response = client2.post(
-            f"/api/v1/things/{order_thing.thing_code}/request/",
+            _thing_request_url(code=order_thing.thing_code),
             {
                 "delivery_date": str(date.today() + timedelta(days=7)),
                 "quantity": 99,
@@ -0,0 +1,13 @@
+"""
+Pytest fixtures for OIUEEI scenario tests.
+"""
+
+import pytest
+
+from .factories import arrange_users
+
+
+@pytest.fixture
+def alice_bob_charlie(db):
+    """Create the journey's users. Returns {name: (user, access_token)}."""
+    return arrange_users(["alice", "bob", "charlie"])
@@ -0,0 +1,60 @@
+"""
+Setup helpers for OIUEEI scenario tests.
+
+These build the state a flow starts from directly through the ORM, with the
+same bookkeeping the views do, so only the steps under test go through the API.
+"""
+
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.models import RSVP, Collection, Theeeme, Thing, User
+
+
+def arrange_users(names):
+    """
+    Create one user per name with a single INSERT (no per-user signals run).
+
+    Returns {name: (user, access_token)}; emails are <name>@example.com.
+    """
+    users = User.objects.bulk_create([User(user_email=f"{name}@example.com") for name in names])
+    return {
+        name: (user, str(RefreshToken.for_user(user).access_token))
+        for name, user in zip(names, users)
+    }
+
+
+def make_collection(owner, **kwargs):
+    """Create a collection owned by owner and record it in the owner's collections."""
+    kwargs.setdefault("collection_theeeme", Theeeme.objects.filter(theeeme_code="JMPA01").first())
+    collection = Collection.objects.create(collection_owner=owner.user_code, **kwargs)
+
+    owner.user_own_collections.append(collection.collection_code)
+    owner.save(update_fields=["user_own_collections"])
+    return collection
+
+
+def make_thing(collection, **kwargs):
+    """Create a thing owned by the collection's owner and add it to the collection."""
+    thing = Thing.objects.create(thing_owner=collection.collection_owner, **kwargs)
+
+    owner = User.objects.get(user_code=collection.collection_owner)
+    owner.user_things.append(thing.thing_code)
+    owner.save(update_fields=["user_things"])
+
+    collection.add_thing(thing.thing_code)
+    return thing
+
+
+def invite(collection, email):
+    """
+    Invite email to collection without sending mail.
+
+    Returns the pending COLLECTION_INVITE RSVP; verify it to accept the invite.
+    """
+    invited_user, _ = User.objects.get_or_create(user_email=email)
+    return RSVP.objects.create(
+        user_code=invited_user.user_code,
+        user_email=email,
+        rsvp_action="COLLECTION_INVITE",
+        collection_code=collection.collection_code,
+    )
@@ -2,12 +2,36 @@
 Scenario tests for complete user flows in OIUEEI.
 """
 
+from functools import lru_cache
+
 import pytest
+from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APIClient
-from rest_framework_simplejwt.tokens import RefreshToken
 
-from core.models import RSVP, User
+from core.models import RSVP, Thing, User
+
+from .factories import invite, make_collection, make_thing
+
+pytestmark = pytest.mark.slow
+
+
+@lru_cache(maxsize=None)
+def _url(name, **kwargs):
+    """Reverse a core URL name once per distinct set of arguments."""
+    return reverse(name, kwargs=kwargs)
+
+
+def _accept_booking(client, booking_code):
+    """Follow the owner's BOOKING_ACCEPT link for booking_code and return the response."""
+    rsvp_code = RSVP.objects.values_list("rsvp_code", flat=True).get(
+        rsvp_action="BOOKING_ACCEPT", rsvp_target_code=booking_code
+    )
+    return client.get(_url("rsvp-action", rsvp_code=rsvp_code))
+
+
+def _switch_user(client, auth_header):
+    """Make subsequent requests from client with the given Authorization header."""
+    client.defaults["HTTP_AUTHORIZATION"] = auth_header
 
 
 @pytest.mark.django_db
@@ -19,7 +43,7 @@ class TestMagicLinkFlow:
     3. User gets session with JWT
     """
 
-    def test_complete_magic_link_flow(self, api_client):
+    def test_complete_magic_link_flow(self, scenario_client):
         """Test complete magic link authentication flow for existing user."""
         email = "inviteduser@example.com"
 
@@ -27,30 +51,30 @@ class TestMagicLinkFlow:
         user = User.objects.create(user_email=email)
 
         # Step 1: Request magic link
-        response = api_client.post(
-            "/api/v1/auth/request-link/",
+        response = scenario_client.post(
+            _url("request-link"),
             {"email": email},
             format="json",
         )
         assert response.status_code == status.HTTP_200_OK
 
         # Verify RSVP was created
-        rsvp = RSVP.objects.get(user_code=user.user_code)
+        rsvp_code = RSVP.objects.values_list("rsvp_code", flat=True).get(user_code=user.user_code)
 
         # Step 2: Verify magic link
-        response = api_client.get(f"/api/v1/auth/verify/{rsvp.rsvp_code}/")
+        response = scenario_client.get(_url("verify-link", rsvp_code=rsvp_code))
         assert response.status_code == status.HTTP_200_OK
         assert "token" in response.data
         assert "refresh" in response.data
         assert response.data["user"]["user_code"] == user.user_code
 
         # Verify RSVP was deleted (one-time use)
-        assert not RSVP.objects.filter(rsvp_code=rsvp.rsvp_code).exists()
+        assert not RSVP.objects.filter(rsvp_code=rsvp_code).exists()
 
         # Step 3: Use token to access protected endpoint
         token = response.data["token"]
-        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
-        response = api_client.get("/api/v1/auth/me/")
+        _switch_user(scenario_client, f"Bearer {token}")
+        response = scenario_client.get(_url("me"))
         assert response.status_code == status.HTTP_200_OK
         assert response.data["user_email"] == email
 
@@ -68,7 +92,7 @@ class TestCreateCollectionFlow:
         """Test complete collection creation flow."""
         # Step 1: Create collection
         response = authenticated_client.post(
-            "/api/v1/collections/",
+            _url("collection-list"),
             {
                 "collection_headline": "My Birthday Wishlist",
                 "collection_description": "Things I want for my birthday",
@@ -80,7 +104,7 @@ class TestCreateCollectionFlow:
 
         # Step 2: Create thing and add to collection
         response = authenticated_client.post(
-            "/api/v1/things/",
+            _url("thing-list"),
             {
                 "thing_headline": "Red Bicycle",
                 "thing_type": "GIFT_THING",
@@ -93,12 +117,14 @@ class TestCreateCollectionFlow:
         thing_code = response.data["thing_code"]
 
         # Step 3: Verify thing is in collection
-        response = authenticated_client.get(f"/api/v1/collections/{collection_code}/")
+        response = authenticated_client.get(
+            _url("collection-detail", collection_code=collection_code)
+        )
         assert response.status_code == status.HTTP_200_OK
         assert thing_code in response.data["collection_things"]
 
         # Step 4: Verify user's collections and things are updated
-        response = authenticated_client.get("/api/v1/auth/me/")
+        response = authenticated_client.get(_url("me"))
         assert collection_code in response.data["user_own_collections"]
         assert thing_code in response.data["user_things"]
 
@@ -113,99 +139,63 @@ class TestShareCollectionFlow:
     4. Friend reserves thing
     """
 
-    def test_complete_share_collection_flow(self):
+    def test_complete_share_collection_flow(
+        self,
+        scenario_client,
+        owner_user,
+        friend_user,
+        friend_auth_header,
+        django_assert_max_num_queries,
+    ):
         """Test complete collection sharing flow."""
-        client = APIClient()
-
-        # Create owner
-        owner = User.objects.create(
-            user_code="OWNER1",
-            user_email="owner@example.com",
-            user_name="Owner",
-        )
-        owner_token = RefreshToken.for_user(owner)
-
-        # Create friend
-        friend = User.objects.create(
-            user_code="FRND01",
-            user_email="friend@example.com",
-            user_name="Friend",
-        )
-        friend_token = RefreshToken.for_user(friend)
-
-        # Step 1: Owner creates collection
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {owner_token.access_token}")
-        response = client.post(
-            "/api/v1/collections/",
-            {"collection_headline": "Gift Ideas"},
-            format="json",
-        )
-        collection_code = response.data["collection_code"]
-
-        # Step 2: Owner creates thing
-        response = client.post(
-            "/api/v1/things/",
-            {
-                "thing_headline": "Coffee Machine",
-                "thing_type": "GIFT_THING",
-                "collection_code": collection_code,
-            },
-            format="json",
-        )
-        thing_code = response.data["thing_code"]
-
-        # Step 3: Owner invites friend
-        response = client.post(
-            f"/api/v1/collections/{collection_code}/invite/",
-            {"email": "friend@example.com"},
-            format="json",
-        )
-        assert response.status_code == status.HTTP_200_OK
+        client = scenario_client
+        # Setup mutates the owner's lists, so work on a fresh copy of the shared owner
+        owner = User.objects.get(pk=owner_user[0].pk)
+        friend = friend_user[0]
+
+        # Steps 1-3 (setup): owner creates collection and thing, invites friend
+        collection = make_collection(owner, collection_headline="Gift Ideas")
+        collection_code = collection.collection_code
+        thing_code = make_thing(
+            collection, thing_headline="Coffee Machine", thing_type="GIFT_THING"
+        ).thing_code
+        rsvp = invite(collection, friend.user_email)
 
         # Step 3.5: Friend accepts invitation by verifying RSVP
-        from core.models import RSVP
-
-        rsvp = RSVP.objects.get(user_email="friend@example.com")
-        response = client.get(f"/api/v1/auth/verify/{rsvp.rsvp_code}/")
+        response = client.get(_url("verify-link", rsvp_code=rsvp.rsvp_code))
         assert response.status_code == status.HTTP_200_OK
 
         # Step 4: Friend views shared collections
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {friend_token.access_token}")
-        friend.refresh_from_db()
+        _switch_user(client, friend_auth_header)
 
-        response = client.get("/api/v1/invited-collections/")
+        with django_assert_max_num_queries(3):
+            response = client.get(_url("invited-collections"))
         assert response.status_code == status.HTTP_200_OK
-        assert any(c["collection_code"] == collection_code for c in response.data)
+        assert collection_code in {c["collection_code"] for c in response.data}
 
         # Step 5: Friend views collection
-        response = client.get(f"/api/v1/collections/{collection_code}/")
+        with django_assert_max_num_queries(3):
+            response = client.get(_url("collection-detail", collection_code=collection_code))
         assert response.status_code == status.HTTP_200_OK
         assert thing_code in response.data["collection_things"]
 
         # Step 6: Friend requests thing (BookingPeriod flow)
-        response = client.post(f"/api/v1/things/{thing_code}/request/")
+        response = client.post(_url("thing-request", thing_code=thing_code))
         assert response.status_code == status.HTTP_200_OK
         assert response.data["message"] == "Booking request sent"
         booking_code = response.data["booking_code"]
 
         # Thing status should be TAKEN (awaiting owner approval)
-        from core.models import Thing
-
         thing = Thing.objects.get(thing_code=thing_code)
         assert thing.thing_status == "TAKEN"
 
-        # Step 7: Owner accepts the booking via RSVP
-        # Find the accept RSVP
-        accept_rsvp = RSVP.objects.get(
-            rsvp_action="BOOKING_ACCEPT",
-            rsvp_target_code=booking_code,
-        )
-        response = client.get(f"/api/v1/rsvp/{accept_rsvp.rsvp_code}/")
+        # Step 7: Owner accepts the booking via the RSVP link from the email
+        response = _accept_booking(client, booking_code)
         assert response.status_code == status.HTTP_200_OK
         assert response.data["action"] == "BOOKING_ACCEPT"
 
         # Step 8: Verify thing is now INACTIVE and friend is in thing_deal
-        thing.refresh_from_db()
+        thing.refresh_from_db(fields=["thing_status", "thing_available", "thing_deal"])
         assert thing.thing_status == "INACTIVE"
         assert thing.thing_available is False
         assert friend.user_code in thing.thing_deal
@@ -220,62 +210,38 @@ class TestFAQFlow:
     3. Question is visible to all
     """
 
-    def test_complete_faq_flow(self):
+    def test_complete_faq_flow(
+        self,
+        scenario_client,
+        owner_user,
+        friend_user,
+        owner_auth_header,
+        friend_auth_header,
+        django_assert_max_num_queries,
+    ):
         """Test complete FAQ flow."""
-        client = APIClient()
-
-        # Create owner
-        owner = User.objects.create(
-            user_code="OWNER2",
-            user_email="owner2@example.com",
-            user_name="Owner",
-        )
-        owner_token = RefreshToken.for_user(owner)
-
-        # Create friend
-        friend = User.objects.create(
-            user_code="FRND02",
-            user_email="friend2@example.com",
-            user_name="Friend",
-        )
-        friend_token = RefreshToken.for_user(friend)
-
-        # Owner creates collection and thing
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {owner_token.access_token}")
-        response = client.post(
-            "/api/v1/collections/",
-            {"collection_headline": "For Sale"},
-            format="json",
-        )
-        collection_code = response.data["collection_code"]
-
-        response = client.post(
-            "/api/v1/things/",
-            {
-                "thing_headline": "Vintage Camera",
-                "thing_type": "SELL_THING",
-                "thing_fee": "150.00",
-                "collection_code": collection_code,
-            },
-            format="json",
-        )
-        thing_code = response.data["thing_code"]
-
-        # Owner invites friend
-        client.post(
-            f"/api/v1/collections/{collection_code}/invite/",
-            {"email": "friend2@example.com"},
-            format="json",
-        )
+        client = scenario_client
+        # Setup mutates the owner's lists, so work on a fresh copy of the shared owner
+        owner = User.objects.get(pk=owner_user[0].pk)
+        friend = friend_user[0]
+
+        # Setup: owner creates collection and thing, invites friend
+        collection = make_collection(owner, collection_headline="For Sale")
+        thing_code = make_thing(
+            collection,
+            thing_headline="Vintage Camera",
+            thing_type="SELL_THING",
+            thing_fee="150.00",
+        ).thing_code
+        rsvp = invite(collection, friend.user_email)
 
         # Friend accepts invitation by verifying RSVP
-        rsvp = RSVP.objects.get(user_email="friend2@example.com")
-        client.get(f"/api/v1/auth/verify/{rsvp.rsvp_code}/")
+        client.get(_url("verify-link", rsvp_code=rsvp.rsvp_code))
 
         # Step 1: Friend asks question
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {friend_token.access_token}")
+        _switch_user(client, friend_auth_header)
         response = client.post(
-            f"/api/v1/things/{thing_code}/faq/",
+            _url("thing-faq-list", thing_code=thing_code),
             {"faq_question": "Does it work with film?"},
             format="json",
         )
@@ -284,9 +250,9 @@ class TestFAQFlow:
         assert response.data["faq_answer"] == ""
 
         # Step 2: Owner answers question
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {owner_token.access_token}")
+        _switch_user(client, owner_auth_header)
         response = client.post(
-            f"/api/v1/faq/{faq_code}/answer/",
+            _url("faq-answer", faq_code=faq_code),
             {"faq_answer": "Yes, it works with 35mm film!"},
             format="json",
         )
@@ -294,179 +260,169 @@ class TestFAQFlow:
         assert response.data["faq_answer"] == "Yes, it works with 35mm film!"
 
         # Step 3: Friend can see answered question
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {friend_token.access_token}")
-        response = client.get(f"/api/v1/things/{thing_code}/faq/")
+        _switch_user(client, friend_auth_header)
+        with django_assert_max_num_queries(4):
+            response = client.get(_url("thing-faq-list", thing_code=thing_code))
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data) == 1
         assert response.data[0]["faq_answer"] == "Yes, it works with 35mm film!"
 
 
+def _journey_alice_fills_profile(client, state):
+    """Alice, already signed in, fills in her profile."""
+    _switch_user(client, state["alice_auth"])
+    client.put(
+        _url("user-detail", user_code=state["alice_code"]),
+        {"user_name": "Alice", "user_headline": "Birthday coming up!"},
+    )
+
+
+def _journey_alice_creates_wishlist(client, state):
+    """Alice creates a birthday wishlist and adds three gifts in one request."""
+    response = client.post(
+        _url("collection-list"),
+        {
+            "collection_headline": "Alice's Birthday Wishlist",
+            "collection_description": "Things I'd love for my birthday!",
+        },
+    )
+    wishlist_code = response.data["collection_code"]
+    state["wishlist_code"] = wishlist_code
+
+    items = [
+        {"thing_headline": "Wireless Headphones", "thing_fee": "100.00"},
+        {"thing_headline": "Cozy Blanket", "thing_fee": "50.00"},
+        {"thing_headline": "Book: Clean Code", "thing_fee": "35.00"},
+    ]
+    response = client.post(
+        _url("thing-bulk-create"),
+        {
+            "collection_code": wishlist_code,
+            "items": [{**item, "thing_type": "GIFT_THING"} for item in items],
+        },
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    state["thing_codes"] = [thing["thing_code"] for thing in response.data]
+
+
+def _journey_alice_invites_friends(client, state):
+    """Alice invites Bob and Charlie, who both accept."""
+    invite_url = _url("collection-invite", collection_code=state["wishlist_code"])
+
+    response = client.post(invite_url, {"email": "bob@example.com"})
+    state["bob_code"] = response.data["user_code"]
+
+    response = client.post(invite_url, {"email": "charlie@example.com"})
+    state["charlie_code"] = response.data["user_code"]
+
+    # The invite response deliberately omits the RSVP code (it is the invitee's
+    # login link), so read both invitations back in a single query
+    rsvp_codes = dict(
+        RSVP.objects.filter(
+            user_code__in=[state["bob_code"], state["charlie_code"]],
+            rsvp_action="COLLECTION_INVITE",
+        ).values_list("user_code", "rsvp_code")
+    )
+    client.get(_url("verify-link", rsvp_code=rsvp_codes[state["bob_code"]]))
+    client.get(_url("verify-link", rsvp_code=rsvp_codes[state["charlie_code"]]))
+
+
+def _journey_request_and_accept(client, state, thing_code):
+    """Request thing_code as the current user, then accept it as Alice."""
+    response = client.post(_url("thing-request", thing_code=thing_code))
+    data = response.data
+    assert response.status_code == status.HTTP_200_OK
+    assert data["message"] == "Booking request sent"
+
+    _accept_booking(client, data["booking_code"])
+
+
+def _journey_bob_books_headphones(client, state):
+    """Bob finds the shared wishlist and gets the headphones."""
+    _switch_user(client, state["bob_auth"])
+
+    with state["max_queries"](3):
+        response = client.get(_url("invited-collections"))
+    assert len(response.data) == 1
+
+    _journey_request_and_accept(client, state, state["thing_codes"][0])
+
+
+def _journey_charlie_asks_about_book(client, state):
+    """Charlie asks about the book and Alice answers."""
+    _switch_user(client, state["charlie_auth"])
+    response = client.post(
+        _url("thing-faq-list", thing_code=state["thing_codes"][2]),
+        {"faq_question": "Is it the paperback or hardcover?"},
+    )
+    faq_code = response.data["faq_code"]
+
+    _switch_user(client, state["alice_auth"])
+    client.post(_url("faq-answer", faq_code=faq_code), {"faq_answer": "Paperback is fine!"})
+
+
+def _journey_charlie_books_book(client, state):
+    """Charlie gets the book."""
+    _switch_user(client, state["charlie_auth"])
+    _journey_request_and_accept(client, state, state["thing_codes"][2])
+
+
+def _journey_final_state(client, state):
+    """Alice sees two gifts taken and the blanket still available."""
+    thing_codes = state["thing_codes"]
+    _switch_user(client, state["alice_auth"])
+
+    with state["max_queries"](3):
+        response = client.get(_url("collection-detail", collection_code=state["wishlist_code"]))
+    assert len(response.data["collection_things"]) == 3
+
+    # The collection GET covers the API; read the three things back in one query
+    things = Thing.objects.only("thing_deal", "thing_available").in_bulk(thing_codes)
+    assert state["bob_code"] in things[thing_codes[0]].thing_deal
+    assert state["charlie_code"] in things[thing_codes[2]].thing_deal
+
+    # Blanket still available
+    assert things[thing_codes[1]].thing_available is True
+
+
+# Ordered (name, step) pairs; each step reads and extends the shared journey state.
+JOURNEY_STEPS = [
+    ("alice_fills_profile", _journey_alice_fills_profile),
+    ("alice_creates_wishlist", _journey_alice_creates_wishlist),
+    ("alice_invites_friends", _journey_alice_invites_friends),
+    ("bob_books_headphones", _journey_bob_books_headphones),
+    ("charlie_asks_about_book", _journey_charlie_asks_about_book),
+    ("charlie_books_book", _journey_charlie_books_book),
+    ("final_state", _journey_final_state),
+]
+
+
 @pytest.mark.django_db
 class TestCompleteUserJourney:
     """
     Scenario: Complete user journey from signup to transaction.
+
+    The journey is driven through JOURNEY_STEPS. Steps build on each other's
+    database rows, which are rolled back after every test, so they run in order
+    inside a single test; a failure names the step that broke.
     """
 
-    def test_complete_user_journey(self):
+    def test_complete_user_journey(
+        self, scenario_client, alice_bob_charlie, django_assert_max_num_queries
+    ):
         """Test a complete user journey through the application."""
-        client = APIClient()
-
-        # === Alice signs up and creates a wishlist ===
-
-        # Alice was invited earlier (user must exist first in invite-only system)
-        alice = User.objects.create(user_email="alice@example.com")
-
-        # Alice requests magic link
-        response = client.post(
-            "/api/v1/auth/request-link/",
-            {"email": "alice@example.com"},
-            format="json",
-        )
-        assert response.status_code == status.HTTP_200_OK
-
-        alice_rsvp = RSVP.objects.get(user_code=alice.user_code)
-
-        # Alice verifies and gets token
-        response = client.get(f"/api/v1/auth/verify/{alice_rsvp.rsvp_code}/")
-        alice_token = response.data["token"]
-
-        # Alice updates profile
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {alice_token}")
-        client.put(
-            f"/api/v1/users/{alice.user_code}/",
-            {"user_name": "Alice", "user_headline": "Birthday coming up!"},
-            format="json",
-        )
-
-        # Alice creates birthday wishlist
-        response = client.post(
-            "/api/v1/collections/",
-            {
-                "collection_headline": "Alice's Birthday Wishlist",
-                "collection_description": "Things I'd love for my birthday!",
-            },
-            format="json",
-        )
-        wishlist_code = response.data["collection_code"]
-
-        # Alice adds items to wishlist
-        items = [
-            {"thing_headline": "Wireless Headphones", "thing_fee": "100.00"},
-            {"thing_headline": "Cozy Blanket", "thing_fee": "50.00"},
-            {"thing_headline": "Book: Clean Code", "thing_fee": "35.00"},
-        ]
-
-        thing_codes = []
-        for item in items:
-            response = client.post(
-                "/api/v1/things/",
-                {
-                    **item,
-                    "thing_type": "GIFT_THING",
-                    "collection_code": wishlist_code,
-                },
-                format="json",
-            )
-            thing_codes.append(response.data["thing_code"])
-
-        # === Alice invites Bob and Charlie ===
-
-        response = client.post(
-            f"/api/v1/collections/{wishlist_code}/invite/",
-            {"email": "bob@example.com"},
-            format="json",
-        )
-        bob = User.objects.get(user_email="bob@example.com")
-
-        response = client.post(
-            f"/api/v1/collections/{wishlist_code}/invite/",
-            {"email": "charlie@example.com"},
-            format="json",
-        )
-        charlie = User.objects.get(user_email="charlie@example.com")
-
-        # === Bob and Charlie accept invitations ===
-
-        bob_rsvp = RSVP.objects.get(user_email="bob@example.com")
-        client.get(f"/api/v1/auth/verify/{bob_rsvp.rsvp_code}/")
-
-        charlie_rsvp = RSVP.objects.get(user_email="charlie@example.com")
-        client.get(f"/api/v1/auth/verify/{charlie_rsvp.rsvp_code}/")
-
-        # === Bob logs in and requests an item ===
-
-        bob_token = RefreshToken.for_user(bob)
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {bob_token.access_token}")
-
-        # Bob views shared collections
-        response = client.get("/api/v1/invited-collections/")
-        assert len(response.data) == 1
-
-        # Bob requests headphones (BookingPeriod flow)
-        response = client.post(f"/api/v1/things/{thing_codes[0]}/request/")
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data["message"] == "Booking request sent"
-        bob_booking_code = response.data["booking_code"]
-
-        # Alice accepts Bob's request
-        bob_accept_rsvp = RSVP.objects.get(
-            rsvp_action="BOOKING_ACCEPT",
-            rsvp_target_code=bob_booking_code,
-        )
-        client.get(f"/api/v1/rsvp/{bob_accept_rsvp.rsvp_code}/")
-
-        # === Charlie asks a question ===
-
-        charlie_token = RefreshToken.for_user(charlie)
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {charlie_token.access_token}")
-
-        # Charlie asks about the book
-        response = client.post(
-            f"/api/v1/things/{thing_codes[2]}/faq/",
-            {"faq_question": "Is it the paperback or hardcover?"},
-            format="json",
-        )
-        faq_code = response.data["faq_code"]
-
-        # === Alice answers the question ===
-
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {alice_token}")
-        response = client.post(
-            f"/api/v1/faq/{faq_code}/answer/",
-            {"faq_answer": "Paperback is fine!"},
-            format="json",
-        )
-
-        # === Charlie requests the book ===
-
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {charlie_token.access_token}")
-        response = client.post(f"/api/v1/things/{thing_codes[2]}/request/")
-        assert response.status_code == status.HTTP_200_OK
-        assert response.data["message"] == "Booking request sent"
-        charlie_booking_code = response.data["booking_code"]
-
-        # Alice accepts Charlie's request
-        charlie_accept_rsvp = RSVP.objects.get(
-            rsvp_action="BOOKING_ACCEPT",
-            rsvp_target_code=charlie_booking_code,
-        )
-        client.get(f"/api/v1/rsvp/{charlie_accept_rsvp.rsvp_code}/")
-
-        # === Final state verification ===
-
-        client.credentials(HTTP_AUTHORIZATION=f"Bearer {alice_token}")
-
-        # Alice sees her collection status
-        response = client.get(f"/api/v1/collections/{wishlist_code}/")
-        assert len(response.data["collection_things"]) == 3
-
-        # Check reservations
-        response = client.get(f"/api/v1/things/{thing_codes[0]}/")
-        assert bob.user_code in response.data["thing_deal"]
-
-        response = client.get(f"/api/v1/things/{thing_codes[2]}/")
-        assert charlie.user_code in response.data["thing_deal"]
-
-        # Blanket still available
-        response = client.get(f"/api/v1/things/{thing_codes[1]}/")
-        assert response.data["thing_available"] is True
+        # Magic-link onboarding is covered by TestMagicLinkFlow; start with Alice signed in
+        # Build each user's Authorization header once for the whole journey
+        alice, alice_token = alice_bob_charlie["alice"]
+        state = {
+            "alice_code": alice.user_code,
+            "alice_auth": f"Bearer {alice_token}",
+            "bob_auth": f"Bearer {alice_bob_charlie['bob'][1]}",
+            "charlie_auth": f"Bearer {alice_bob_charlie['charlie'][1]}",
+            "max_queries": django_assert_max_num_queries,
+        }
+        for name, step in JOURNEY_STEPS:
+            try:
+                step(scenario_client, state)
+            except AssertionError as exc:
+                raise AssertionError(f"journey step {name!r} failed: {exc}") from exc
@@ -0,0 +1,83 @@
+"""
+Unit tests for OIUEEI authentication classes.
+"""
+
+import pytest
+from django.test import override_settings
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.authentication import CachedJWTAuthentication, get_user_by_code
+from core.models import User
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    """Tests for the cached user lookup behind JWT authentication."""
+
+    def test_second_lookup_skips_database(self, user, django_assert_num_queries):
+        """Should load the user once and serve repeat requests from the cache."""
+        token = AccessToken.for_user(user)
+        auth = CachedJWTAuthentication()
+
+        with django_assert_num_queries(1):
+            assert auth.get_user(token) == user
+            assert auth.get_user(token) == user
+
+    def test_save_drops_cached_user(self, user):
+        """Should return fresh data after the user is saved."""
+        get_user_by_code(user.user_code)
+
+        user.user_name = "Renamed"
+        user.save(update_fields=["user_name"])
+
+        assert get_user_by_code(user.user_code).user_name == "Renamed"
+
+    def test_deleted_user_rejected(self, user):
+        """Should fail authentication once the user is deleted."""
+        token = AccessToken.for_user(user)
+        auth = CachedJWTAuthentication()
+        auth.get_user(token)
+
+        user.delete()
+
+        with pytest.raises(AuthenticationFailed):
+            auth.get_user(token)
+
+    def test_password_change_revokes_token(self, monkeypatch, user):
+        """Should keep simplejwt's revoke-token check when CHECK_REVOKE_TOKEN is on."""
+        # Patch the shared instance: overriding SIMPLE_JWT rebinds api_settings in
+        # simplejwt.settings only, not in the modules that imported it
+        monkeypatch.setattr(api_settings, "CHECK_REVOKE_TOKEN", True)
+        token = AccessToken.for_user(user)
+        auth = CachedJWTAuthentication()
+        assert auth.get_user(token) == user
+
+        user.set_password("changed")
+        user.save(update_fields=["password"])
+
+        with pytest.raises(AuthenticationFailed) as exc_info:
+            auth.get_user(token)
+        assert exc_info.value.detail["code"] == "password_changed"
+
+    @override_settings(USER_CACHE_TIMEOUT=0)
+    def test_timeout_zero_disables_cache(self, user, django_assert_num_queries):
+        """Should query the database every time when USER_CACHE_TIMEOUT is 0."""
+        with django_assert_num_queries(2):
+            get_user_by_code(user.user_code)
+            get_user_by_code(user.user_code)
+
+    def test_saving_views_ignore_stale_cached_user(self, authenticated_client, user):
+        """Should add the new thing to the stored list, not to a stale cached copy."""
+        get_user_by_code(user.user_code)
+        # A write that skips post_save leaves the cached copy stale
+        User.objects.filter(pk=user.pk).update(user_things=["AAAAAA"])
+
+        response = authenticated_client.post(
+            "/api/v1/things/", {"thing_headline": "Bici"}, format="json"
+        )
+
+        assert response.status_code == 201
+        user.refresh_from_db()
+        assert user.user_things == ["AAAAAA", response.data["thing_code"]]
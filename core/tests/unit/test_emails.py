@@ -0,0 +1,45 @@
+"""
+Unit tests for OIUEEI email helpers.
+"""
+
+from django.core import mail
+from django.test import override_settings
+
+from core.emails import send_mail_async
+
+MESSAGE = {
+    "subject": "Hola",
+    "message": "Hola!",
+    "from_email": None,
+    "recipient_list": ["test@example.com"],
+}
+
+
+class TestSendMailAsync:
+    """Tests for send_mail_async."""
+
+    def test_sends_inline_by_default(self):
+        """Should send before returning when EMAIL_SEND_ASYNC is off."""
+        assert send_mail_async(**MESSAGE) is None
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == ["test@example.com"]
+
+    @override_settings(EMAIL_SEND_ASYNC=True)
+    def test_sends_on_background_thread(self):
+        """Should hand the email to a background thread when EMAIL_SEND_ASYNC is on."""
+        thread = send_mail_async(**MESSAGE)
+        thread.join(timeout=5)
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].subject == "Hola"
+
+    @override_settings(EMAIL_SEND_ASYNC=True)
+    def test_background_failure_is_logged(self, monkeypatch, caplog):
+        """Should log, not raise, when the background send fails."""
+
+        def refuse(**kwargs):
+            raise ConnectionRefusedError
+
+        monkeypatch.setattr("core.emails.send_mail", refuse)
+        thread = send_mail_async(**MESSAGE)
+        thread.join(timeout=5)
+        assert "Failed to send email to ['test@example.com']" in caplog.text
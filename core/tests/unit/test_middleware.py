@@ -0,0 +1,26 @@
+"""
+Unit tests for OIUEEI middleware.
+"""
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from core.middleware import ClientIPMiddleware
+
+
+class TestClientIPMiddleware:
+    """Tests for request.client_ip."""
+
+    def _client_ip(self, **meta):
+        request = RequestFactory().get("/", **meta)
+        ClientIPMiddleware(lambda request: HttpResponse())(request)
+        return request.client_ip
+
+    def test_uses_first_forwarded_address(self):
+        """Should take the first X-Forwarded-For entry."""
+        ip = self._client_ip(HTTP_X_FORWARDED_FOR="203.0.113.7, 10.0.0.1", REMOTE_ADDR="10.0.0.2")
+        assert ip == "203.0.113.7"
+
+    def test_falls_back_to_remote_addr(self):
+        """Should use REMOTE_ADDR without X-Forwarded-For."""
+        assert self._client_ip(REMOTE_ADDR="198.51.100.4") == "198.51.100.4"
@@ -2,13 +2,24 @@
 Unit tests for OIUEEI models.
 """
 
-from datetime import timedelta
+from datetime import date, timedelta
 
 import pytest
+from django.test import override_settings
 from django.utils import timezone
 
 from core.models import FAQ, RSVP, Collection, Theeeme, Thing, User
-from core.utils import cloudinary_url, generate_id
+from core.utils import cloudinary_url, cloudinary_urls, generate_id
+
+# Palette of the default BAR_CEL_ONA theeeme, shared by the theeeme construction tests
+THEEEME_COLORS = {
+    "theeeme_01": "FFCA2C",
+    "theeeme_02": "CB4E22",
+    "theeeme_03": "827F2A",
+    "theeeme_04": "2B9A9E",
+    "theeeme_05": "4F3B28",
+    "theeeme_06": "FFF2EB",
+}
 
 
 class TestGenerateId:
@@ -26,8 +37,7 @@ class TestGenerateId:
 
     def test_generate_id_unique(self):
         """IDs should be unique (statistically)."""
-        ids = [generate_id() for _ in range(100)]
-        assert len(set(ids)) == 100
+        assert len({generate_id() for _ in range(100)}) == 100
 
 
 class TestCloudinaryUrl:
@@ -45,14 +55,52 @@ class TestCloudinaryUrl:
         assert cloudinary_url(None) is None
         assert cloudinary_url("") is None
 
+    def test_cloudinary_urls_skips_empty_ids(self):
+        """Should build one URL per non-empty ID, matching cloudinary_url."""
+        assert cloudinary_urls(["abc123", "", "def456"]) == [
+            cloudinary_url("abc123"),
+            cloudinary_url("def456"),
+        ]
+
+    def test_cloudinary_url_follows_cloud_name_setting(self):
+        """Should pick up an overridden cloud name despite the cached prefix."""
+        cloudinary_url("abc123")
+        with override_settings(CLOUDINARY_CLOUD_NAME="other"):
+            assert cloudinary_url("abc123").startswith("https://res.cloudinary.com/other/")
+        assert "/other/" not in cloudinary_url("abc123")
+
+
+class TestUserDefaults:
+    """Tests for User field defaults (set on instantiation, no database needed)."""
+
+    def test_user_collections_default(self):
+        """User collections should default to empty lists."""
+        user = User(user_email="test@example.com")
+        assert user.user_own_collections == []
+        assert user.user_invited_collections == []
+        assert user.user_things == []
+
+    def test_optional_fields_can_be_empty(self):
+        """Optional fields (headline, thumbnail, hero) default to empty strings."""
+        user = User(user_email="test@example.com")
+        assert user.user_headline == ""
+        assert user.user_thumbnail == ""
+        assert user.user_hero == ""
+
+    def test_user_name_is_optional(self):
+        """User name should default to empty string."""
+        user = User(user_email="test@example.com")
+        assert user.user_name == ""
+
 
 @pytest.mark.django_db
 class TestUserModel:
     """Tests for User model."""
 
-    def test_create_user(self):
-        """Should create a user with generated ID."""
-        user = User.objects.create(user_email="test@example.com")
+    def test_create_user(self, django_assert_num_queries):
+        """Should create a user with generated ID in a single INSERT."""
+        with django_assert_num_queries(1):
+            user = User.objects.create(user_email="test@example.com")
         assert len(user.user_code) == 6
         assert user.user_email == "test@example.com"
         assert user.is_active is True
@@ -66,19 +114,21 @@ class TestUserModel:
         assert "ABC123" in str(user)
         assert "test@example.com" in str(user)
 
-    def test_user_collections_default(self):
-        """User collections should default to empty lists."""
-        user = User.objects.create(user_email="test@example.com")
-        assert user.user_own_collections == []
-        assert user.user_invited_collections == []
-        assert user.user_things == []
+    def test_update_last_activity(self, django_assert_num_queries):
+        """Should update last activity date with a single UPDATE."""
+        user = User.objects.create(
+            user_email="test@example.com", user_last_activity=date.today() - timedelta(days=3)
+        )
+        with django_assert_num_queries(1):
+            user.update_last_activity()
+        user.refresh_from_db()
+        assert user.user_last_activity == date.today()
 
-    def test_update_last_activity(self):
-        """Should update last activity date."""
+    def test_update_last_activity_same_day(self, django_assert_num_queries):
+        """Should skip the UPDATE when activity was already recorded today."""
         user = User.objects.create(user_email="test@example.com")
-        old_date = user.user_last_activity
-        user.update_last_activity()
-        assert user.user_last_activity >= old_date
+        with django_assert_num_queries(0):
+            user.update_last_activity()
 
     def test_user_email_must_be_unique(self):
         """Duplicate email should raise IntegrityError."""
@@ -93,13 +143,6 @@ class TestUserModel:
         with pytest.raises(ValueError):
             User.objects.create_user(user_email=None)
 
-    def test_optional_fields_can_be_empty(self):
-        """Optional fields (headline, thumbnail, hero) default to empty strings."""
-        user = User.objects.create(user_email="test@example.com")
-        assert user.user_headline == ""
-        assert user.user_thumbnail == ""
-        assert user.user_hero == ""
-
     def test_optional_fields_can_be_set(self):
         """Optional fields can be populated."""
         user = User.objects.create(
@@ -119,11 +162,6 @@ class TestUserModel:
         user = User.objects.create(user_email="test@example.com")
         assert user.user_created == date.today()
 
-    def test_user_name_is_optional(self):
-        """User name should default to empty string."""
-        user = User.objects.create(user_email="test@example.com")
-        assert user.user_name == ""
-
 
 @pytest.mark.django_db
 class TestRSVPModel:
@@ -146,16 +184,26 @@ class TestRSVPModel:
         )
         assert rsvp.is_valid() is True
 
-    def test_rsvp_expired(self):
+    def test_rsvp_expired(self, frozen_clock):
         """Old RSVP should be invalid."""
         rsvp = RSVP.objects.create(
             user_code="ABC123",
             user_email="test@example.com",
+            rsvp_created=frozen_clock.instant,
         )
-        rsvp.rsvp_created = timezone.now() - timedelta(hours=25)
-        rsvp.save()
+        frozen_clock.move_to(frozen_clock.instant + timedelta(hours=25))
         assert rsvp.is_valid() is False
 
+    def test_consume_is_one_time(self):
+        """Only the first consume should return the RSVP; it is deleted."""
+        rsvp = RSVP.objects.create(
+            user_code="ABC123",
+            user_email="test@example.com",
+        )
+        assert RSVP.consume(rsvp.rsvp_code) == rsvp
+        assert RSVP.consume(rsvp.rsvp_code) is None
+        assert not RSVP.objects.filter(rsvp_code=rsvp.rsvp_code).exists()
+
 
 @pytest.mark.django_db
 class TestTheeemeModel:
@@ -165,12 +213,7 @@ class TestTheeemeModel:
         """Should create a theeeme with generated code."""
         theeeme = Theeeme.objects.create(
             theeeme_name="BAR_CEL_ONA",
-            theeeme_01="FFCA2C",
-            theeeme_02="CB4E22",
-            theeeme_03="827F2A",
-            theeeme_04="2B9A9E",
-            theeeme_05="4F3B28",
-            theeeme_06="FFF2EB",
+            **THEEEME_COLORS,
         )
         assert len(theeeme.theeeme_code) == 6
         assert theeeme.theeeme_name == "BAR_CEL_ONA"
@@ -180,124 +223,59 @@ class TestTheeemeModel:
         theeeme = Theeeme.objects.create(
             theeeme_code="TSTSTR",
             theeeme_name="TestTheme",
-            theeeme_01="FFCA2C",
-            theeeme_02="CB4E22",
-            theeeme_03="827F2A",
-            theeeme_04="2B9A9E",
-            theeeme_05="4F3B28",
-            theeeme_06="FFF2EB",
+            **THEEEME_COLORS,
         )
         assert "TSTSTR" in str(theeeme)
         assert "TestTheme" in str(theeeme)
 
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures("theeeme_query_budget")
 class TestCollectionModel:
     """Tests for Collection model."""
 
-    def test_create_collection(self, default_theeeme):
-        """Should create a collection with generated code."""
-        collection = Collection.objects.create(
-            collection_owner="ABC123",
-            collection_headline="My Collection",
-            collection_theeeme=default_theeeme,
-        )
+    def test_create_collection(self, default_theeeme, django_assert_num_queries):
+        """Should create a collection with generated code in a single INSERT."""
+        with django_assert_num_queries(1):
+            collection = Collection.objects.create(
+                collection_owner="ABC123",
+                collection_headline="My Collection",
+                collection_theeeme=default_theeeme,
+            )
         assert len(collection.collection_code) == 6
         assert collection.collection_status == "ACTIVE"
         assert collection.collection_theeeme == default_theeeme
 
-    def test_add_thing(self, default_theeeme):
+    def test_add_thing(self, pooled_collection):
         """Should add thing to collection."""
-        collection = Collection.objects.create(
-            collection_owner="ABC123",
-            collection_headline="My Collection",
-            collection_theeeme=default_theeeme,
-        )
+        collection = pooled_collection
         collection.add_thing("THNG01")
         assert "THNG01" in collection.collection_things
 
-    def test_remove_thing(self, default_theeeme):
+    def test_remove_thing(self, pooled_collection):
         """Should remove thing from collection."""
-        collection = Collection.objects.create(
-            collection_owner="ABC123",
-            collection_headline="My Collection",
-            collection_things=["THNG01", "THNG02"],
-            collection_theeeme=default_theeeme,
-        )
+        collection = pooled_collection
+        collection.collection_things = ["THNG01", "THNG02"]
         collection.remove_thing("THNG01")
         assert "THNG01" not in collection.collection_things
         assert "THNG02" in collection.collection_things
 
-    def test_add_invite(self, default_theeeme):
+    def test_add_invite(self, pooled_collection):
         """Should add user to invites."""
-        collection = Collection.objects.create(
-            collection_owner="ABC123",
-            collection_headline="My Collection",
-            collection_theeeme=default_theeeme,
-        )
+        collection = pooled_collection
         collection.add_invite("USR001")
         assert "USR001" in collection.collection_invites
 
-    def test_is_owner(self, default_theeeme):
-        """Should check ownership correctly."""
-        collection = Collection.objects.create(
-            collection_owner="ABC123",
-            collection_headline="My Collection",
-            collection_theeeme=default_theeeme,
-        )
-        assert collection.is_owner("ABC123") is True
-        assert collection.is_owner("XYZ789") is False
-
-    def test_can_view(self, default_theeeme):
-        """Should check view permission correctly."""
-        collection = Collection.objects.create(
-            collection_owner="ABC123",
-            collection_headline="My Collection",
-            collection_invites=["USR001"],
-            collection_theeeme=default_theeeme,
-        )
-        assert collection.can_view("ABC123") is True  # Owner
-        assert collection.can_view("USR001") is True  # Invited
-        assert collection.can_view("XYZ789") is False  # Neither
-
-    def test_remove_invite(self, default_theeeme):
+    def test_remove_invite(self, pooled_collection):
         """Should remove user from invites."""
-        collection = Collection.objects.create(
-            collection_owner="ABC123",
-            collection_headline="My Collection",
-            collection_invites=["USR001", "USR002"],
-            collection_theeeme=default_theeeme,
-        )
+        collection = pooled_collection
+        collection.collection_invites = ["USR001", "USR002"]
         collection.remove_invite("USR001")
         assert "USR001" not in collection.collection_invites
         assert "USR002" in collection.collection_invites
 
-    def test_is_invited(self, default_theeeme):
-        """Should check if user is invited."""
-        collection = Collection.objects.create(
-            collection_owner="ABC123",
-            collection_headline="My Collection",
-            collection_invites=["USR001"],
-            collection_theeeme=default_theeeme,
-        )
-        assert collection.is_invited("USR001") is True
-        assert collection.is_invited("USR002") is False
-        assert collection.is_invited("ABC123") is False  # Owner is not in invites
-
-    def test_collection_defaults(self, default_theeeme):
-        """Collection things and invites should default to empty lists."""
-        collection = Collection.objects.create(
-            collection_owner="ABC123",
-            collection_headline="My Collection",
-            collection_theeeme=default_theeeme,
-        )
-        assert collection.collection_things == []
-        assert collection.collection_invites == []
-
     def test_collection_created_timestamp(self, default_theeeme):
         """Collection should have creation timestamp."""
-        from django.utils import timezone
-
         before = timezone.now()
         collection = Collection.objects.create(
             collection_owner="ABC123",
@@ -307,50 +285,81 @@ class TestCollectionModel:
         after = timezone.now()
         assert before <= collection.collection_created <= after
 
-    def test_optional_fields_default_empty(self, default_theeeme):
-        """Optional fields should default to empty strings."""
-        collection = Collection.objects.create(
+    @pytest.mark.parametrize(
+        "method,attr,code",
+        [
+            ("add_thing", "collection_things", "THNG01"),
+            ("add_invite", "collection_invites", "USR001"),
+        ],
+    )
+    def test_add_idempotent(self, pooled_collection, method, attr, code):
+        """Adding the same thing or invite twice should not duplicate it."""
+        collection = pooled_collection
+        getattr(collection, method)(code)
+        getattr(collection, method)(code)
+        assert getattr(collection, attr).count(code) == 1
+
+
+class TestCollectionDefaults:
+    """Tests for Collection field defaults (set on instantiation, no database needed)."""
+
+    def _collection(self):
+        theeeme = Theeeme(theeeme_code="JMPA01", theeeme_name="BAR_CEL_ONA", **THEEEME_COLORS)
+        return Collection(
             collection_owner="ABC123",
             collection_headline="My Collection",
-            collection_theeeme=default_theeeme,
+            collection_theeeme=theeeme,
         )
+
+    def test_collection_defaults(self):
+        """Collection things and invites should default to empty lists."""
+        collection = self._collection()
+        assert collection.collection_things == []
+        assert collection.collection_invites == []
+
+    def test_optional_fields_default_empty(self):
+        """Optional fields should default to empty strings."""
+        collection = self._collection()
         assert collection.collection_description == ""
         assert collection.collection_thumbnail == ""
         assert collection.collection_hero == ""
 
-    def test_add_thing_idempotent(self, default_theeeme):
-        """Adding same thing twice should not duplicate."""
-        collection = Collection.objects.create(
-            collection_owner="ABC123",
-            collection_headline="My Collection",
-            collection_theeeme=default_theeeme,
-        )
-        collection.add_thing("THNG01")
-        collection.add_thing("THNG01")
-        assert collection.collection_things.count("THNG01") == 1
 
-    def test_add_invite_idempotent(self, default_theeeme):
-        """Adding same invite twice should not duplicate."""
-        collection = Collection.objects.create(
-            collection_owner="ABC123",
-            collection_headline="My Collection",
-            collection_theeeme=default_theeeme,
-        )
-        collection.add_invite("USR001")
-        collection.add_invite("USR001")
-        assert collection.collection_invites.count("USR001") == 1
+class TestCollectionAccess:
+    """Tests for Collection ownership and invite checks (no database needed)."""
+
+    def test_is_owner(self):
+        """Should check ownership correctly."""
+        collection = Collection(collection_owner="ABC123")
+        assert collection.is_owner("ABC123") is True
+        assert collection.is_owner("XYZ789") is False
+
+    def test_can_view(self):
+        """Should check view permission correctly."""
+        collection = Collection(collection_owner="ABC123", collection_invites=["USR001"])
+        assert collection.can_view("ABC123") is True  # Owner
+        assert collection.can_view("USR001") is True  # Invited
+        assert collection.can_view("XYZ789") is False  # Neither
+
+    def test_is_invited(self):
+        """Should check if user is invited."""
+        collection = Collection(collection_owner="ABC123", collection_invites=["USR001"])
+        assert collection.is_invited("USR001") is True
+        assert collection.is_invited("USR002") is False
+        assert collection.is_invited("ABC123") is False  # Owner is not in invites
 
 
 @pytest.mark.django_db
 class TestThingModel:
     """Tests for Thing model."""
 
-    def test_create_thing(self):
-        """Should create a thing with generated code."""
-        thing = Thing.objects.create(
-            thing_owner="ABC123",
-            thing_headline="My Thing",
-        )
+    def test_create_thing(self, django_assert_num_queries):
+        """Should create a thing with generated code in a single INSERT."""
+        with django_assert_num_queries(1):
+            thing = Thing.objects.create(
+                thing_owner="ABC123",
+                thing_headline="My Thing",
+            )
         assert len(thing.thing_code) == 6
         assert thing.thing_type == "GIFT_THING"
         assert thing.thing_status == "ACTIVE"
@@ -392,34 +401,28 @@ class TestThingModel:
 class TestFAQModel:
     """Tests for FAQ model."""
 
-    def test_create_faq(self):
-        """Should create a FAQ with generated code."""
-        faq = FAQ.objects.create(
-            faq_thing="THNG01",
-            faq_questioner="USR001",
-            faq_question="Is this available?",
-        )
+    def test_create_faq(self, django_assert_num_queries):
+        """Should create a FAQ with generated code in a single INSERT."""
+        with django_assert_num_queries(1):
+            faq = FAQ.objects.create(
+                faq_thing="THNG01",
+                faq_questioner="USR001",
+                faq_question="Is this available?",
+            )
         assert len(faq.faq_code) == 6
         assert faq.faq_is_visible is True
         assert faq.faq_answer == ""
 
-    def test_has_answer(self):
-        """Should check if answered correctly."""
+    def test_answer(self):
+        """Should start unanswered, then store the answer and report it as answered."""
         faq = FAQ.objects.create(
             faq_thing="THNG01",
             faq_questioner="USR001",
             faq_question="Is this available?",
         )
         assert faq.has_answer() is False
-        faq.answer("Yes it is!")
-        assert faq.has_answer() is True
+        assert faq.faq_answer == ""
 
-    def test_answer(self):
-        """Should set answer correctly."""
-        faq = FAQ.objects.create(
-            faq_thing="THNG01",
-            faq_questioner="USR001",
-            faq_question="Is this available?",
-        )
         faq.answer("Yes it is!")
+        assert faq.has_answer() is True
         assert faq.faq_answer == "Yes it is!"
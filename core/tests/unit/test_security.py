@@ -2,38 +2,60 @@
 Unit tests for OIUEEI security features.
 """
 
+import ast
+import inspect
 import string
+from functools import lru_cache
 
-from core.utils import generate_id
+import pytest
+
+from core import utils
+from core.utils import generate_id, generate_ids
+
+VALID_ID_CHARS = frozenset(string.ascii_uppercase + string.digits)
+
+
+@lru_cache(maxsize=1)
+def _generate_id_calls():
+    """Return the dotted names of every function called by generate_id, parsed once."""
+    tree = ast.parse(inspect.getsource(utils.generate_id))
+    return frozenset(
+        ast.unparse(node.func) for node in ast.walk(tree) if isinstance(node, ast.Call)
+    )
+
+
+@pytest.fixture(scope="module")
+def id_batch():
+    """Generate one batch of 1000 IDs shared by the ID invariant tests."""
+    return tuple(generate_id() for _ in range(1000))
 
 
 class TestSecureIdGeneration:
     """Tests for cryptographically secure ID generation."""
 
-    def test_generate_id_length(self):
+    def test_generate_id_length(self, id_batch):
         """ID should be exactly 6 characters."""
-        for _ in range(100):
-            assert len(generate_id()) == 6
+        assert {len(id_) for id_ in id_batch} == {6}
 
-    def test_generate_id_characters(self):
+    def test_generate_id_characters(self, id_batch):
         """ID should only contain uppercase letters and digits."""
-        valid_chars = set(string.ascii_uppercase + string.digits)
-        for _ in range(100):
-            id_ = generate_id()
-            assert all(c in valid_chars for c in id_)
+        assert set("".join(id_batch)) <= VALID_ID_CHARS
 
-    def test_generate_id_uniqueness(self):
+    def test_generate_id_uniqueness(self, id_batch):
         """IDs should be unique (statistically unlikely to collide in 1000 attempts)."""
-        ids = set(generate_id() for _ in range(1000))
         # With 36^6 = 2.17 billion possibilities, 1000 IDs should be unique
-        assert len(ids) == 1000
+        assert len(set(id_batch)) == 1000
 
     def test_generate_id_uses_secrets_module(self):
         """Verify that secrets module is used (via inspection)."""
-        import inspect
+        calls = _generate_id_calls()
+        assert "secrets.randbelow" in calls
+        assert not any(call.startswith("random.") for call in calls)
 
-        from core import utils
-
-        source = inspect.getsource(utils.generate_id)
-        assert "secrets.choice" in source
-        assert "random.choice" not in source
+    def test_generate_ids_batch(self):
+        """A batch should hold the requested number of valid, distinct IDs."""
+        ids = generate_ids(1000)
+        assert len(ids) == 1000
+        assert {len(id_) for id_ in ids} == {6}
+        assert set("".join(ids)) <= VALID_ID_CHARS
+        assert len(set(ids)) == 1000
@@ -4,7 +4,7 @@ Unit tests for OIUEEI serializers.
 
 import pytest
 
-from core.models import FAQ, Collection, Thing, User
+from core.models import FAQ, Collection, Theeeme, Thing, User
 from core.serializers import (
     CollectionCreateSerializer,
     CollectionSerializer,
@@ -34,13 +34,12 @@ class TestRequestLinkSerializer:
         assert "email" in serializer.errors
 
 
-@pytest.mark.django_db
 class TestUserSerializer:
     """Tests for UserSerializer."""
 
     def test_serialize_user(self):
         """Should serialize user with all fields."""
-        user = User.objects.create(
+        user = User(
             user_code="ABC123",
             user_email="test@example.com",
             user_name="Test User",
@@ -56,13 +55,12 @@ class TestUserSerializer:
         assert "cloudinary" in data["user_thumbnail_url"]
 
 
-@pytest.mark.django_db
 class TestUserPublicSerializer:
     """Tests for UserPublicSerializer."""
 
     def test_serialize_public_user(self):
         """Should serialize only public fields."""
-        user = User.objects.create(
+        user = User(
             user_code="ABC123",
             user_email="test@example.com",
             user_name="Test User",
@@ -75,18 +73,17 @@ class TestUserPublicSerializer:
         assert "user_email" not in data
 
 
-@pytest.mark.django_db
 class TestCollectionSerializer:
     """Tests for CollectionSerializer."""
 
-    def test_serialize_collection(self, default_theeeme):
+    def test_serialize_collection(self):
         """Should serialize collection with all fields."""
-        collection = Collection.objects.create(
+        collection = Collection(
             collection_code="COLL01",
             collection_owner="ABC123",
             collection_headline="My Collection",
             collection_thumbnail="thumb123",
-            collection_theeeme=default_theeeme,
+            collection_theeeme=Theeeme(theeeme_code="JMPA01"),
         )
         serializer = CollectionSerializer(collection)
         data = serializer.data
@@ -96,6 +93,24 @@ class TestCollectionSerializer:
         assert data["collection_thumbnail_url"] is not None
         assert data["collection_theeeme"] == "JMPA01"
 
+    @pytest.mark.django_db
+    def test_serialize_many_in_one_query(self, default_theeeme, django_assert_num_queries):
+        """A list fetched with select_related should serialize without per-row theeeme loads."""
+        Collection.objects.bulk_create(
+            Collection(
+                collection_owner="ABC123",
+                collection_headline=f"Collection {i}",
+                collection_theeeme=default_theeeme,
+            )
+            for i in range(3)
+        )
+        collections = Collection.objects.select_related("collection_theeeme")
+
+        with django_assert_num_queries(1):
+            data = CollectionSerializer(collections, many=True).data
+
+        assert [c["collection_theeeme"] for c in data] == ["JMPA01"] * 3
+
 
 class TestCollectionCreateSerializer:
     """Tests for CollectionCreateSerializer."""
@@ -127,13 +142,12 @@ class TestCollectionCreateSerializer:
         assert "collection_headline" in serializer.errors
 
 
-@pytest.mark.django_db
 class TestThingSerializer:
     """Tests for ThingSerializer."""
 
     def test_serialize_thing(self):
         """Should serialize thing with all fields."""
-        thing = Thing.objects.create(
+        thing = Thing(
             thing_code="THNG01",
             thing_owner="ABC123",
             thing_headline="My Thing",
@@ -166,13 +180,12 @@ class TestThingCreateSerializer:
         assert not serializer.is_valid()
 
 
-@pytest.mark.django_db
 class TestFAQSerializer:
     """Tests for FAQSerializer."""
 
     def test_serialize_faq(self):
         """Should serialize FAQ with all fields."""
-        faq = FAQ.objects.create(
+        faq = FAQ(
             faq_code="FAQ001",
             faq_thing="THNG01",
             faq_questioner="USR001",
@@ -5,8 +5,9 @@ IMPORTANT: All email action links use RSVP codes as intermediaries.
 Never expose real codes (booking_code, reservation_code, etc.) in URLs.
 """
 
-from django.urls import path
+from django.urls import path, register_converter
 
+from .converters import CodeConverter, VisibilityActionConverter
 from .views.auth import LogoutView, MeView, RequestLinkView, VerifyLinkView
 from .views.booking import MyBookingsView, OwnerBookingsView, ThingCalendarView
 from .views.collections import (
@@ -17,20 +18,26 @@ from .views.collections import (
 )
 from .views.faq import FAQAnswerView, FAQDetailView, FAQVisibilityView, ThingFAQListView
 from .views.reservations import ThingRequestView
-from .views.things import InvitedThingsView, ThingDetailView, ThingListView
+from .views.things import InvitedThingsView, ThingBulkCreateView, ThingDetailView, ThingListView
 from .views.users import UserDetailView
 
+register_converter(CodeConverter, "code")
+register_converter(VisibilityActionConverter, "visibility")
+
+# VerifyLinkView backs two routes; both share a single as_view() callable
+verify_link_view = VerifyLinkView.as_view()
+
 urlpatterns = [
     # Auth & RSVP Actions
     path("auth/request-link/", RequestLinkView.as_view(), name="request-link"),
-    path("auth/verify/<str:rsvp_code>/", VerifyLinkView.as_view(), name="verify-link"),
+    path("auth/verify/<str:rsvp_code>/", verify_link_view, name="verify-link"),
     path("auth/me/", MeView.as_view(), name="me"),
     path("auth/logout/", LogoutView.as_view(), name="logout"),
     # RSVP action endpoint (unified handler for all email-based actions)
     # Handles: MAGIC_LINK, COLLECTION_INVITE, RESERVATION_ACCEPT/REJECT, BOOKING_ACCEPT/REJECT
-    path("rsvp/<str:rsvp_code>/", VerifyLinkView.as_view(), name="rsvp-action"),
+    path("rsvp/<str:rsvp_code>/", verify_link_view, name="rsvp-action"),
     # Users
-    path("users/<str:user_code>/", UserDetailView.as_view(), name="user-detail"),
+    path("users/<code:user_code>/", UserDetailView.as_view(), name="user-detail"),
     # Collections
     path("collections/", CollectionListView.as_view(), name="collection-list"),
     path(
@@ -39,23 +46,24 @@ urlpatterns = [
         name="invited-collections",
     ),
     path(
-        "collections/<str:collection_code>/",
+        "collections/<code:collection_code>/",
         CollectionDetailView.as_view(),
         name="collection-detail",
     ),
     path(
-        "collections/<str:collection_code>/invite/",
+        "collections/<code:collection_code>/invite/",
         CollectionInviteView.as_view(),
         name="collection-invite",
     ),
     # Things
     path("things/", ThingListView.as_view(), name="thing-list"),
+    path("things/bulk/", ThingBulkCreateView.as_view(), name="thing-bulk-create"),
     path("invited-things/", InvitedThingsView.as_view(), name="invited-things"),
-    path("things/<str:thing_code>/", ThingDetailView.as_view(), name="thing-detail"),
+    path("things/<code:thing_code>/", ThingDetailView.as_view(), name="thing-detail"),
     # NOTE: /reserve/ and /release/ endpoints removed - use /request/ with BookingPeriod flow
-    path("things/<str:thing_code>/request/", ThingRequestView.as_view(), name="thing-request"),
+    path("things/<code:thing_code>/request/", ThingRequestView.as_view(), name="thing-request"),
     path(
-        "things/<str:thing_code>/calendar/",
+        "things/<code:thing_code>/calendar/",
         ThingCalendarView.as_view(),
         name="thing-calendar",
     ),
@@ -63,19 +71,13 @@ urlpatterns = [
     path("my-bookings/", MyBookingsView.as_view(), name="my-bookings"),
     path("owner-bookings/", OwnerBookingsView.as_view(), name="owner-bookings"),
     # FAQ
-    path("things/<str:thing_code>/faq/", ThingFAQListView.as_view(), name="thing-faq-list"),
-    path("faq/<str:faq_code>/", FAQDetailView.as_view(), name="faq-detail"),
-    path("faq/<str:faq_code>/answer/", FAQAnswerView.as_view(), name="faq-answer"),
-    path(
-        "faq/<str:faq_code>/hide/",
-        FAQVisibilityView.as_view(),
-        {"action": "hide"},
-        name="faq-hide",
-    ),
+    path("things/<code:thing_code>/faq/", ThingFAQListView.as_view(), name="thing-faq-list"),
+    path("faq/<code:faq_code>/", FAQDetailView.as_view(), name="faq-detail"),
+    path("faq/<code:faq_code>/answer/", FAQAnswerView.as_view(), name="faq-answer"),
+    # Hide or show: /faq/{faq_code}/hide/ and /faq/{faq_code}/show/
     path(
-        "faq/<str:faq_code>/show/",
+        "faq/<code:faq_code>/<visibility:action>/",
         FAQVisibilityView.as_view(),
-        {"action": "show"},
-        name="faq-show",
+        name="faq-visibility",
     ),
 ]
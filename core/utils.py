@@ -4,19 +4,71 @@ Utility functions for OIUEEI.
 
 import secrets
 import string
+from functools import lru_cache
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+ID_CHARS = string.ascii_uppercase + string.digits
+ID_LENGTH = 6
+_ID_SPACE = len(ID_CHARS) ** ID_LENGTH
+
+# generate_ids reads five random bytes per ID and redraws anything at or above the
+# last whole multiple of 36^6, so every ID stays equally likely
+_DRAW_BYTES = 5
+_DRAW_LIMIT = (256**_DRAW_BYTES // _ID_SPACE) * _ID_SPACE
+
+
+def _spell_id(n):
+    """Spell a number below 36^6 as a 6-character ID."""
+    chars = []
+    for _ in range(ID_LENGTH):
+        n, digit = divmod(n, len(ID_CHARS))
+        chars.append(ID_CHARS[digit])
+    return "".join(chars)
 
 
 def generate_id():
     """Generate a unique 6-character alphanumeric ID in uppercase."""
-    chars = string.ascii_uppercase + string.digits
-    return "".join(secrets.choice(chars) for _ in range(6))
+    # One uniform draw over all 36^6 IDs, spelled out in base 36
+    return _spell_id(secrets.randbelow(_ID_SPACE))
+
+
+def generate_ids(count):
+    """Generate count IDs like generate_id, from a single read of the system CSPRNG."""
+    ids = []
+    while len(ids) < count:
+        buf = secrets.token_bytes(_DRAW_BYTES * (count - len(ids)))
+        for i in range(0, len(buf), _DRAW_BYTES):
+            n = int.from_bytes(buf[i : i + _DRAW_BYTES], "big")
+            if n < _DRAW_LIMIT:
+                ids.append(_spell_id(n % _ID_SPACE))
+    return ids
 
 
 def cloudinary_url(image_id):
     """Build Cloudinary URL from image ID."""
     if not image_id:
         return None
+    return _cloudinary_prefix() + image_id + ".png"
+
+
+def cloudinary_urls(image_ids):
+    """Build Cloudinary URLs for a list of image IDs, skipping empty ones."""
+    prefix = _cloudinary_prefix()
+    return [prefix + image_id + ".png" for image_id in image_ids if image_id]
+
+
+@lru_cache(maxsize=None)
+def _cloudinary_prefix():
+    """Read the cloud name once; serializers build these URLs for every image field of every row."""
     cloud_name = getattr(settings, "CLOUDINARY_CLOUD_NAME", "oiueei")
-    return f"https://res.cloudinary.com/{cloud_name}/image/upload/v1676535186/oiueei/{image_id}.png"
+    return f"https://res.cloudinary.com/{cloud_name}/image/upload/v1676535186/oiueei/"
+
+
+@receiver(setting_changed)
+def _reset_cloudinary_prefix(setting, **kwargs):
+    """Drop the cached prefix when a test overrides CLOUDINARY_CLOUD_NAME."""
+    if setting == "CLOUDINARY_CLOUD_NAME":
+        _cloudinary_prefix.cache_clear()
@@ -7,7 +7,7 @@ from .collections import (
     InvitedCollectionsView,
 )
 from .faq import FAQAnswerView, FAQDetailView, FAQVisibilityView, ThingFAQListView
-from .things import ThingDetailView, ThingListView
+from .things import ThingBulkCreateView, ThingDetailView, ThingListView
 from .users import UserDetailView
 
 __all__ = [
@@ -20,6 +20,7 @@ __all__ = [
     "CollectionInviteView",
     "InvitedCollectionsView",
     "ThingListView",
+    "ThingBulkCreateView",
     "ThingDetailView",
     "ThingFAQListView",
     "FAQDetailView",
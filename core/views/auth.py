@@ -10,7 +10,6 @@ import logging
 
 from django.conf import settings
 from django.contrib.auth import login
-from django.core.mail import send_mail
 from django.utils.decorators import method_decorator
 from django_ratelimit.decorators import ratelimit
 from rest_framework import status
@@ -19,6 +18,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from core.emails import send_mail_async
 from core.models import RSVP, Collection, Thing, User
 from core.models.booking import SINGLE_USE_TYPES, BookingPeriod
 from core.serializers import RequestLinkSerializer, UserSerializer
@@ -40,7 +40,7 @@ class RequestLinkView(APIView):
         serializer.is_valid(raise_exception=True)
 
         email = serializer.validated_data["email"].lower()
-        ip = self._get_client_ip(request)
+        ip = request.client_ip
 
         # INVITE-ONLY: Only existing users can request magic links
         try:
@@ -68,7 +68,7 @@ class RequestLinkView(APIView):
         )
         magic_link = f"{magic_link_base}/{rsvp.rsvp_code}"
 
-        send_mail(
+        send_mail_async(
             subject="Tu enlace de acceso a OIUEEI",
             message=f"Hola! Haz clic aquí para acceder: {magic_link}",
             from_email=None,
@@ -86,13 +86,6 @@ class RequestLinkView(APIView):
             status=status.HTTP_200_OK,
         )
 
-    def _get_client_ip(self, request):
-        """Get client IP address from request."""
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            return x_forwarded_for.split(",")[0].strip()
-        return request.META.get("REMOTE_ADDR", "unknown")
-
 
 class VerifyLinkView(APIView):
     """
@@ -110,11 +103,11 @@ class VerifyLinkView(APIView):
 
     @method_decorator(ratelimit(key="ip", rate="10/m", method="GET", block=True))
     def get(self, request, rsvp_code):
-        ip = self._get_client_ip(request)
+        ip = request.client_ip
 
-        try:
-            rsvp = RSVP.objects.get(rsvp_code=rsvp_code)
-        except RSVP.DoesNotExist:
+        # Links are one-time use: claim the RSVP before acting on it
+        rsvp = RSVP.consume(rsvp_code)
+        if rsvp is None:
             security_logger.warning(f"Invalid RSVP code attempted from IP {ip}")
             return Response(
                 {"error": "Invalid or expired link"},
@@ -123,7 +116,6 @@ class VerifyLinkView(APIView):
 
         if not rsvp.is_valid():
             security_logger.warning(f"Expired RSVP code used from IP {ip}")
-            rsvp.delete()
             return Response(
                 {"error": "Link expired"},
                 status=status.HTTP_401_UNAUTHORIZED,
@@ -142,13 +134,12 @@ class VerifyLinkView(APIView):
 
     def _handle_magic_link(self, request, rsvp):
         """Handle magic link authentication."""
-        ip = self._get_client_ip(request)
+        ip = request.client_ip
 
         # Get user
         try:
             user = User.objects.get(user_code=rsvp.user_code)
         except User.DoesNotExist:
-            rsvp.delete()
             return Response(
                 {"error": "User not found"},
                 status=status.HTTP_401_UNAUTHORIZED,
@@ -163,9 +154,6 @@ class VerifyLinkView(APIView):
         # Also login via session for browser access
         login(request, user)
 
-        # Delete RSVP (one-time use)
-        rsvp.delete()
-
         security_logger.info(f"User {user.user_email} logged in via magic link from IP {ip}")
 
         # Return token and user data
@@ -181,20 +169,12 @@ class VerifyLinkView(APIView):
             status=status.HTTP_200_OK,
         )
 
-    def _get_client_ip(self, request):
-        """Get client IP address from request."""
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            return x_forwarded_for.split(",")[0].strip()
-        return request.META.get("REMOTE_ADDR", "unknown")
-
     def _handle_collection_invite(self, request, rsvp):
         """Handle collection invitation acceptance."""
         # Get user
         try:
             user = User.objects.get(user_code=rsvp.user_code)
         except User.DoesNotExist:
-            rsvp.delete()
             return Response(
                 {"error": "User not found"},
                 status=status.HTTP_401_UNAUTHORIZED,
@@ -224,9 +204,6 @@ class VerifyLinkView(APIView):
         # Also login via session for browser access
         login(request, user)
 
-        # Delete RSVP (one-time use)
-        rsvp.delete()
-
         # Return token and user data
         user_data = UserSerializer(user).data
 
@@ -249,14 +226,12 @@ class VerifyLinkView(APIView):
         try:
             booking = BookingPeriod.objects.get(booking_code=booking_code)
         except BookingPeriod.DoesNotExist:
-            rsvp.delete()
             return Response(
                 {"error": "Booking not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
         if not booking.is_valid():
-            rsvp.delete()
             return Response(
                 {"error": "Booking expired or already processed"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -266,7 +241,6 @@ class VerifyLinkView(APIView):
         try:
             thing = Thing.objects.get(thing_code=booking.thing_code)
         except Thing.DoesNotExist:
-            rsvp.delete()
             return Response(
                 {"error": "Thing not found"},
                 status=status.HTTP_404_NOT_FOUND,
@@ -310,7 +284,7 @@ class VerifyLinkView(APIView):
             subject = f"Tu reserva ha sido aceptada: {thing.thing_headline}"
 
         # Send confirmation email to requester
-        send_mail(
+        send_mail_async(
             subject=subject,
             message=message,
             from_email=None,
@@ -324,9 +298,6 @@ class VerifyLinkView(APIView):
             """,
         )
 
-        # Delete RSVP (one-time use)
-        rsvp.delete()
-
         # Build response
         response_data = {
             "action": "BOOKING_ACCEPT",
@@ -351,14 +322,12 @@ class VerifyLinkView(APIView):
         try:
             booking = BookingPeriod.objects.get(booking_code=booking_code)
         except BookingPeriod.DoesNotExist:
-            rsvp.delete()
             return Response(
                 {"error": "Booking not found"},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
         if not booking.is_valid():
-            rsvp.delete()
             return Response(
                 {"error": "Booking expired or already processed"},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -368,7 +337,6 @@ class VerifyLinkView(APIView):
         try:
             thing = Thing.objects.get(thing_code=booking.thing_code)
         except Thing.DoesNotExist:
-            rsvp.delete()
             return Response(
                 {"error": "Thing not found"},
                 status=status.HTTP_404_NOT_FOUND,
@@ -409,7 +377,7 @@ class VerifyLinkView(APIView):
             subject = f"Tu reserva ha sido rechazada: {thing.thing_headline}"
 
         # Send rejection email to requester
-        send_mail(
+        send_mail_async(
             subject=subject,
             message=message,
             from_email=None,
@@ -423,9 +391,6 @@ class VerifyLinkView(APIView):
             """,
         )
 
-        # Delete RSVP (one-time use)
-        rsvp.delete()
-
         return Response(
             {
                 "action": "BOOKING_REJECT",
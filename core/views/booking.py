@@ -76,7 +76,8 @@ class MyBookingsView(APIView):
             "-booking_created"
         )
 
-        serializer = MyBookingSerializer(bookings, many=True)
+        # iterator(): serialize rows as they are read instead of caching model instances
+        serializer = MyBookingSerializer(bookings.iterator(), many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
 
 
@@ -89,14 +90,11 @@ class OwnerBookingsView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        # Get all things owned by user
-        owned_things = Thing.objects.filter(thing_owner=request.user.user_code)
-        thing_codes = [t.thing_code for t in owned_things]
-
-        # Get all bookings for those things
-        bookings = BookingPeriod.objects.filter(thing_code__in=thing_codes).order_by(
+        # Bookings for the user's things, with the owned things as a subquery
+        owned_things = Thing.objects.filter(thing_owner=request.user.user_code).values("thing_code")
+        bookings = BookingPeriod.objects.filter(thing_code__in=owned_things).order_by(
             "-booking_created"
         )
 
-        serializer = BookingPeriodSerializer(bookings, many=True)
+        serializer = BookingPeriodSerializer(bookings.iterator(), many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
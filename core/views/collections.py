@@ -32,7 +32,9 @@ class CollectionListView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        collections = Collection.objects.filter(collection_owner=request.user.user_code)
+        collections = Collection.objects.filter(
+            collection_owner=request.user.user_code
+        ).select_related("collection_theeeme")
         serializer = CollectionSerializer(collections, many=True)
         return Response(serializer.data)
 
@@ -52,10 +54,11 @@ class CollectionListView(APIView):
             **validated_data,
         )
 
-        # Add to user's own collections
-        if collection.collection_code not in request.user.user_own_collections:
-            request.user.user_own_collections.append(collection.collection_code)
-            request.user.save(update_fields=["user_own_collections"])
+        # Add to user's own collections (request.user may be a cached copy, so reload it)
+        owner = User.objects.get(pk=request.user.pk)
+        if collection.collection_code not in owner.user_own_collections:
+            owner.user_own_collections.append(collection.collection_code)
+            owner.save(update_fields=["user_own_collections"])
 
         return Response(
             CollectionSerializer(collection).data,
@@ -187,10 +190,11 @@ class CollectionDetailView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        # Remove from user's collections
-        if collection_code in request.user.user_own_collections:
-            request.user.user_own_collections.remove(collection_code)
-            request.user.save(update_fields=["user_own_collections"])
+        # Remove from user's collections (request.user may be a cached copy, so reload it)
+        owner = User.objects.get(pk=request.user.pk)
+        if collection_code in owner.user_own_collections:
+            owner.user_own_collections.remove(collection_code)
+            owner.save(update_fields=["user_own_collections"])
 
         collection.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -347,7 +351,7 @@ class InvitedCollectionsView(APIView):
     def get(self, request):
         user_code = request.user.user_code
         # Use Python-side filtering for SQLite compatibility
-        all_collections = Collection.objects.all()
+        all_collections = Collection.objects.select_related("collection_theeeme")
         invited_collections = [c for c in all_collections if user_code in c.collection_invites]
         serializer = CollectionSerializer(invited_collections, many=True)
         return Response(serializer.data)
@@ -0,0 +1,18 @@
+"""
+Error handlers for OIUEEI.
+"""
+
+from django.http import JsonResponse
+from django.views.defaults import page_not_found
+
+
+def not_found(request, exception):
+    """
+    Return the API's JSON error body for unmatched /api/ URLs.
+
+    URL converters reject malformed codes before any view runs; this keeps those
+    404s in the same {"error": ...} shape the views use. Other paths get Django's page.
+    """
+    if request.path.startswith("/api/"):
+        return JsonResponse({"error": "Not found"}, status=404)
+    return page_not_found(request, exception)
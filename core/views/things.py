@@ -2,13 +2,20 @@
 Thing views for OIUEEI.
 """
 
+from django.db import transaction
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from core.models import Collection, Thing
-from core.serializers import ThingCreateSerializer, ThingSerializer, ThingUpdateSerializer
+from core.models import Collection, Thing, User
+from core.serializers import (
+    ThingBulkCreateSerializer,
+    ThingCreateSerializer,
+    ThingSerializer,
+    ThingUpdateSerializer,
+)
+from core.utils import generate_ids
 
 
 class ThingListView(APIView):
@@ -36,10 +43,11 @@ class ThingListView(APIView):
             **serializer.validated_data,
         )
 
-        # Add to user's things
-        if thing.thing_code not in request.user.user_things:
-            request.user.user_things.append(thing.thing_code)
-            request.user.save(update_fields=["user_things"])
+        # Add to user's things (request.user may be a cached copy, so reload it)
+        owner = User.objects.get(pk=request.user.pk)
+        if thing.thing_code not in owner.user_things:
+            owner.user_things.append(thing.thing_code)
+            owner.save(update_fields=["user_things"])
 
         # If collection_code is provided, add to collection
         collection_code = request.data.get("collection_code")
@@ -57,6 +65,60 @@ class ThingListView(APIView):
         )
 
 
+class ThingBulkCreateView(APIView):
+    """
+    POST /api/v1/things/bulk/
+    Create several things in one request.
+
+    Things are inserted with a single bulk INSERT, and the user's things
+    and the optional collection are each saved once.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = ThingBulkCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        owner_code = request.user.user_code
+        items = serializer.validated_data["items"]
+
+        with transaction.atomic():
+            things = Thing.objects.bulk_create(
+                [
+                    Thing(thing_code=code, thing_owner=owner_code, **item)
+                    for code, item in zip(generate_ids(len(items)), items)
+                ]
+            )
+            thing_codes = [thing.thing_code for thing in things]
+
+            # Add to user's things (request.user may be a cached copy, so reload it)
+            owner = User.objects.get(pk=request.user.pk)
+            new_codes = [code for code in thing_codes if code not in owner.user_things]
+            if new_codes:
+                owner.user_things.extend(new_codes)
+                owner.save(update_fields=["user_things"])
+
+            # If collection_code is provided, add to collection
+            collection_code = serializer.validated_data.get("collection_code")
+            if collection_code:
+                try:
+                    collection = Collection.objects.get(collection_code=collection_code)
+                    if collection.is_owner(owner_code):
+                        new_codes = [
+                            code for code in thing_codes if code not in collection.collection_things
+                        ]
+                        collection.collection_things.extend(new_codes)
+                        collection.save(update_fields=["collection_things"])
+                except Collection.DoesNotExist:
+                    pass
+
+        return Response(
+            ThingSerializer(things, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
+
 class ThingDetailView(APIView):
     """
     GET /api/v1/things/{thing_code}/
@@ -128,10 +190,11 @@ class ThingDetailView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        # Remove from user's things
-        if thing_code in request.user.user_things:
-            request.user.user_things.remove(thing_code)
-            request.user.save(update_fields=["user_things"])
+        # Remove from user's things (request.user may be a cached copy, so reload it)
+        owner = User.objects.get(pk=request.user.pk)
+        if thing_code in owner.user_things:
+            owner.user_things.remove(thing_code)
+            owner.save(update_fields=["user_things"])
 
         # Remove from all collections
         for collection in Collection.objects.filter(collection_owner=request.user.user_code):
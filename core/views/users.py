@@ -81,8 +81,10 @@ class UserDetailView(APIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        serializer = UserUpdateSerializer(request.user, data=request.data, partial=True)
+        # save() writes every column, so update a fresh row rather than a cached request.user
+        user = User.objects.get(pk=request.user.pk)
+        serializer = UserUpdateSerializer(user, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
-        return Response(UserSerializer(request.user).data)
+        return Response(UserSerializer(user).data)